@@ -251,7 +251,7 @@ class BookMyShowBot:
                 log.info("Monitoring all events")
                 
             # Initialize and start scheduler
-            scheduler_manager.initialize()
+            await scheduler_manager.start_async()
             job_id = scheduler_manager.schedule_regular_monitoring(
                 interval=interval,
                 event_ids=event_ids,
@@ -291,11 +291,13 @@ class BookMyShowBot:
         
         try:
             log.info("Starting event monitoring")
-            newly_available = await event_tracker.monitor_events(
+            newly_available = []
+            async for event in event_tracker.monitor_events(
                 event_ids=event_ids,
-                single_run=single_run,
-                notification_callback=on_ticket_available
-            )
+                single_run=single_run
+            ):
+                newly_available.append(event.event_id)
+                await on_ticket_available(event)
             
             self.running = False
             return newly_available
@@ -475,6 +477,10 @@ class BookMyShowBot:
         # Close browser
         await browser_manager.close()
         
+        # Deliver pending notifications, then close notification connections
+        await notification_manager.drain(timeout=10)
+        await notification_manager.close()
+        
         # Shutdown scheduler if running
         if hasattr(scheduler_manager, 'scheduler') and scheduler_manager.running:
             scheduler_manager.shutdown()
@@ -492,6 +498,7 @@ class BookMyShowBot:
             balance: Current balance (if known)
         """
         payment_processor.add_gift_card(card_number, pin, balance)
+        payment_processor.flush()
         log.info(f"Added gift card ending in ...{card_number[-4:]}")
     
     def add_proxy(self, host: str, port: int, username: Optional[str] = None, 
@@ -599,7 +606,7 @@ class BookMyShowBot:
         finally:
             await context.close()
     
-    def schedule_sale_date_monitoring(self, event_id: str, sale_date_str: str) -> List[str]:
+    async def schedule_sale_date_monitoring(self, event_id: str, sale_date_str: str) -> List[str]:
         """
         Schedule monitoring for an event with known on-sale date.
         
@@ -617,11 +624,11 @@ class BookMyShowBot:
             log.error(f"Invalid date format: {sale_date_str}. Expected ISO format (YYYY-MM-DDTHH:MM:SS)")
             return []
         
-        # Initialize scheduler
-        scheduler_manager.initialize()
+        # Initialize and start scheduler
+        await scheduler_manager.start_async()
         
         # Schedule monitoring
-        job_ids = scheduler_manager.schedule_sale_date_monitoring(event_id, sale_date)
+        job_ids = await scheduler_manager.aschedule_sale_date_monitoring(event_id, sale_date)
         
         # Get event details for logging
         event = event_tracker.get_event(event_id)
@@ -793,18 +800,19 @@ async def main() -> None:
             if not events:
                 print("No events are being tracked")
             else:
-                print(f"Tracking {len(events)} events:")
+                lines: List[str] = [f"Tracking {len(events)} events:"]
                 for event in events:
                     status = "🟢 AVAILABLE" if event.tickets_available else "🔴 NOT AVAILABLE"
                     status = "⚫️ SOLD OUT" if event.sold_out else status
                     status = "⚪️ NOT ENABLED" if not event.tracking_enabled else status
                     
-                    print(f"- {event.name} ({event.event_id}): {status}")
-                    print(f"  URL: {event.url}")
-                    print(f"  Last checked: {event.last_checked or 'Never'}")
+                    lines.append(f"- {event.name} ({event.event_id}): {status}")
+                    lines.append(f"  URL: {event.url}")
+                    lines.append(f"  Last checked: {event.last_checked or 'Never'}")
                     if event.last_available:
-                        print(f"  Last available: {event.last_available}")
-                    print()
+                        lines.append(f"  Last available: {event.last_available}")
+                    lines.append("")
+                sys.stdout.write("\n".join(lines) + "\n")
             
         elif args.command == "remove":
             success = event_tracker.remove_event(args.event_id)
@@ -823,12 +831,13 @@ async def main() -> None:
                 if not cards:
                     print("No gift cards available")
                 else:
-                    print(f"Available gift cards ({len(cards)}):")
+                    lines: List[str] = [f"Available gift cards ({len(cards)}):"]
                     for i, card in enumerate(cards, 1):
-                        masked_number = f"{'*' * (len(card.card_number) - 4)}{card.card_number[-4:]}"
-                        print(f"{i}. {masked_number} - Balance: ₹{card.balance:.2f}")
+                        masked_number = f"{'*' * (len(card.card_number) - 4)}{card.mask}"
+                        lines.append(f"{i}. {masked_number} - Balance: ₹{card.balance:.2f}")
                         if card.last_used:
-                            print(f"   Last used: {card.last_used}")
+                            lines.append(f"   Last used: {card.last_used}")
+                    sys.stdout.write("\n".join(lines) + "\n")
             else:
                 gift_card_parser.print_help()
         
@@ -861,12 +870,13 @@ async def main() -> None:
                 if not proxies:
                     print("No proxies available")
                 else:
-                    print(f"Available proxies ({len(proxies)}):")
+                    lines: List[str] = [f"Available proxies ({len(proxies)}):"]
                     for i, proxy in enumerate(proxies, 1):
                         status = "🟢 Active" if not proxy["is_banned"] else "🔴 Banned"
-                        print(f"{i}. {proxy['host']}:{proxy['port']} ({proxy['protocol']}) - {status}")
-                        print(f"   Success: {proxy['success_count']}, Failures: {proxy['failure_count']}")
-                        print(f"   Last used: {proxy['last_used']}")
+                        lines.append(f"{i}. {proxy['host']}:{proxy['port']} ({proxy['protocol']}) - {status}")
+                        lines.append(f"   Success: {proxy['success_count']}, Failures: {proxy['failure_count']}")
+                        lines.append(f"   Last used: {proxy['last_used']}")
+                    sys.stdout.write("\n".join(lines) + "\n")
                         
             elif args.proxy_command == "test":
                 print("Testing proxies...")
@@ -878,7 +888,7 @@ async def main() -> None:
         
         elif args.command == "scheduler":
             if args.scheduler_command == "sale":
-                job_ids = bot.schedule_sale_date_monitoring(args.event_id, args.sale_date)
+                job_ids = await bot.schedule_sale_date_monitoring(args.event_id, args.sale_date)
                 if job_ids:
                     print(f"Scheduled monitoring for event {args.event_id} with sale date {args.sale_date}")
                     print(f"Created {len(job_ids)} monitoring schedules")
@@ -890,11 +900,12 @@ async def main() -> None:
                 if not jobs:
                     print("No scheduled jobs")
                 else:
-                    print(f"Scheduled jobs ({len(jobs)}):")
+                    lines: List[str] = [f"Scheduled jobs ({len(jobs)}):"]
                     for i, job in enumerate(jobs, 1):
-                        print(f"{i}. {job['name']} (ID: {job['id']})")
-                        print(f"   Next run: {job['next_run']}")
-                        print(f"   Trigger: {job['trigger']}")
+                        lines.append(f"{i}. {job['name']} (ID: {job['id']})")
+                        lines.append(f"   Next run: {job['next_run']}")
+                        lines.append(f"   Trigger: {job['trigger']}")
+                    sys.stdout.write("\n".join(lines) + "\n")
                         
             elif args.scheduler_command == "remove":
                 success = bot.remove_scheduled_job(args.job_id)
@@ -10,7 +10,7 @@ import asyncio
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union, Set
+from typing import Dict, List, Optional, Any, Tuple, Union, AsyncIterator
 
 from playwright.async_api import Page, Response
 
@@ -29,6 +29,14 @@ class Event:
     Stores event details, availability status, and monitoring settings.
     """
     
+    __slots__ = (
+        "event_id", "name", "url", "venue", "city", "event_date",
+        "ticket_price_range", "preferred_seats", "expected_on_sale_date",
+        "quantity", "max_price", "tracking_enabled",
+        "tickets_available", "last_checked", "last_available", "check_count",
+        "sold_out", "error_count", "last_error"
+    )
+    
     def __init__(self, 
                 event_id: str, 
                 name: str, 
@@ -92,20 +100,33 @@ class Event:
         Returns:
             Event instance
         """
-        return cls(
+        price_range = data.get("ticket_price_range")
+        
+        event = cls(
             event_id=data.get("event_id", ""),
             name=data.get("name", ""),
             url=data.get("url", ""),
             venue=data.get("venue", ""),
             city=data.get("city", ""),
             event_date=data.get("event_date"),
-            ticket_price_range=tuple(data.get("ticket_price_range", (0, 0))),
+            ticket_price_range=tuple(price_range) if price_range else None,
             preferred_seats=data.get("preferred_seats", []),
             expected_on_sale_date=data.get("expected_on_sale_date"),
             quantity=data.get("quantity", 1),
             max_price=data.get("max_price"),
             tracking_enabled=data.get("tracking_enabled", True)
         )
+        
+        # Restore status tracking
+        event.tickets_available = data.get("tickets_available", False)
+        event.last_checked = data.get("last_checked")
+        event.last_available = data.get("last_available")
+        event.check_count = data.get("check_count", 0)
+        event.sold_out = data.get("sold_out", False)
+        event.error_count = data.get("error_count", 0)
+        event.last_error = data.get("last_error")
+        
+        return event
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -182,8 +203,16 @@ class EventTracker:
         self.accelerated_interval = config.get("monitoring.accelerated_interval", 5)
         self.acceleration_threshold = config.get("monitoring.acceleration_threshold", 30)
         
-        # Load tracked events
+        # Tracked events are loaded on first use
+        self.initialized = False
+    
+    def initialize(self) -> None:
+        """Load tracked events from disk if not already loaded."""
+        if self.initialized:
+            return
+        
         self._load_events()
+        self.initialized = True
     
     def _load_events(self) -> None:
         """
@@ -197,8 +226,7 @@ class EventTracker:
             return
         
         try:
-            with open(self.events_path, "r") as f:
-                event_data = json.load(f)
+            event_data = json.loads(self.events_path.read_bytes())
             
             for event_id, event_dict in event_data.items():
                 self.events[event_id] = Event.from_dict(event_dict)
@@ -211,6 +239,10 @@ class EventTracker:
         """
         Save tracked events to disk.
         """
+        # Never overwrite the file with an unloaded event set
+        if not self.initialized:
+            self.initialize()
+        
         # Ensure the directory exists
         self.events_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -231,6 +263,9 @@ class EventTracker:
         Args:
             event: Event to track
         """
+        if not self.initialized:
+            self.initialize()
+        
         self.events[event.event_id] = event
         logger.info(f"Added event to tracking: {event.name} ({event.event_id})")
         self._save_events()
@@ -245,6 +280,9 @@ class EventTracker:
         Returns:
             True if the event was removed, False if not found
         """
+        if not self.initialized:
+            self.initialize()
+        
         if event_id in self.events:
             event = self.events.pop(event_id)
             logger.info(f"Removed event from tracking: {event.name} ({event_id})")
@@ -263,6 +301,9 @@ class EventTracker:
         Returns:
             Event if found, None otherwise
         """
+        if not self.initialized:
+            self.initialize()
+        
         return self.events.get(event_id)
     
     def get_all_events(self) -> List[Event]:
@@ -272,6 +313,9 @@ class EventTracker:
         Returns:
             List of tracked events
         """
+        if not self.initialized:
+            self.initialize()
+        
         return list(self.events.values())
     
     def get_available_events(self) -> List[Event]:
@@ -281,6 +325,9 @@ class EventTracker:
         Returns:
             List of events with available tickets
         """
+        if not self.initialized:
+            self.initialize()
+        
         return [event for event in self.events.values() 
                 if event.tickets_available and event.tracking_enabled]
     
@@ -372,18 +419,118 @@ class EventTracker:
         # Tickets are available if we found a book button or ticket selection and no sold out message
         return (has_book_button or has_ticket_selection) and not is_sold_out
     
+    def _sale_datetime(self, event: Event) -> Optional[datetime]:
+        """
+        Parse an event's expected on-sale date.
+        
+        Args:
+            event: Event to inspect
+            
+        Returns:
+            On-sale datetime, or None if unknown or invalid
+        """
+        if not event.expected_on_sale_date:
+            return None
+        
+        try:
+            return datetime.fromisoformat(event.expected_on_sale_date)
+        except ValueError:
+            # Invalid date format
+            return None
+    
+    async def _sale_check_burst(self, 
+                                event: Event, 
+                                sale_date: datetime,
+                                found: asyncio.Queue,
+                                check_lock: asyncio.Lock) -> None:
+        """
+        Poll a single event at the accelerated interval around its on-sale date.
+        
+        Sleeps until the acceleration window opens, then checks the event every
+        ``accelerated_interval`` seconds until tickets are found or the window
+        (the same threshold after the sale date) closes.
+        
+        Args:
+            event: Event to monitor
+            sale_date: Expected on-sale date/time of the event
+            found: Queue receiving the event if tickets become available
+            check_lock: Lock held while the event is being checked
+        """
+        window = timedelta(minutes=self.acceleration_threshold)
+        window_start = sale_date - window
+        window_end = sale_date + window
+        
+        delay = (window_start - datetime.now()).total_seconds()
+        if delay > 0:
+            logger.info(f"Scheduled accelerated polling for event {event.name} at {window_start}")
+            await asyncio.sleep(delay)
+        
+        logger.info(f"Using accelerated polling for event {event.name} until {window_end}")
+        
+        while datetime.now() <= window_end:
+            async with check_lock:
+                was_available = event.tickets_available
+                available = await self.check_event(event)
+            
+            if available:
+                if not was_available:
+                    logger.info(f"Tickets just became available for event: {event.name}")
+                    found.put_nowait(event)
+                break
+            
+            await asyncio.sleep(self.accelerated_interval)
+    
+    async def _drain_found(self, found: asyncio.Queue, timeout: float) -> AsyncIterator[Event]:
+        """
+        Yield events reported by sale timers, waiting up to a timeout.
+        
+        Args:
+            found: Queue filled by the sale timers
+            timeout: Maximum time to wait in seconds
+            
+        Yields:
+            Events whose tickets just became available
+        """
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            if not found.empty():
+                yield found.get_nowait()
+                continue
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            
+            try:
+                event = await asyncio.wait_for(found.get(), remaining)
+            except asyncio.TimeoutError:
+                return
+            
+            yield event
+    
     async def monitor_events(self, 
                             event_ids: Optional[List[str]] = None, 
-                            single_run: bool = False,
-                            notification_callback: Optional[callable] = None) -> None:
+                            single_run: bool = False) -> AsyncIterator[Event]:
         """
         Monitor events for ticket availability.
         
+        Yields each event as soon as its tickets become available, so callers
+        can react without waiting for the whole monitoring cycle. In continuous
+        mode, events with an upcoming on-sale date get their own timer that
+        polls at the accelerated interval around the sale; the regular polling
+        loop covers every event outside those windows.
+        
         Args:
             event_ids: IDs of events to monitor, or None to monitor all
             single_run: Run the monitoring loop only once
-            notification_callback: Function to call when tickets become available
+            
+        Yields:
+            Events whose tickets just became available
         """
+        if not self.initialized:
+            self.initialize()
+        
         events_to_monitor = []
         
         if event_ids:
@@ -404,58 +551,63 @@ class EventTracker:
         
         logger.info(f"Starting to monitor {len(events_to_monitor)} events")
         
-        newly_available_events: Set[str] = set()
+        # Give events with an upcoming sale date dedicated timers. They stay in
+        # the regular loop, which skips them only while their window is open
+        found: asyncio.Queue = asyncio.Queue()
+        burst_tasks: Dict[str, Tuple[asyncio.Task, datetime]] = {}
         
-        while True:
-            start_time = time.time()
+        # One check per event at a time, so the loop and a timer checking the
+        # same event can't both report its tickets becoming available
+        check_locks = {event.event_id: asyncio.Lock() for event in events_to_monitor}
+        
+        if not single_run:
+            now = datetime.now()
+            window = timedelta(minutes=self.acceleration_threshold)
             
             for event in events_to_monitor:
-                # Determine if we should use accelerated polling
-                use_accelerated = False
-                
-                if event.expected_on_sale_date:
-                    try:
-                        sale_date = datetime.fromisoformat(event.expected_on_sale_date)
-                        time_until_sale = sale_date - datetime.now()
-                        
-                        if timedelta(minutes=0) <= time_until_sale <= timedelta(minutes=self.acceleration_threshold):
-                            use_accelerated = True
-                            logger.info(f"Using accelerated polling for event {event.name} - {time_until_sale.total_seconds()//60:.0f} minutes until sale")
-                    except ValueError:
-                        # Invalid date format
-                        pass
+                sale_date = self._sale_datetime(event)
                 
-                # Check the event
-                was_available = event.tickets_available
-                available = await self.check_event(event)
+                if sale_date and sale_date + window > now:
+                    task = asyncio.create_task(
+                        self._sale_check_burst(event, sale_date, found, check_locks[event.event_id])
+                    )
+                    burst_tasks[event.event_id] = (task, sale_date - window)
+        
+        try:
+            while True:
+                start_time = time.time()
                 
-                # If tickets just became available
-                if available and not was_available:
-                    logger.info(f"Tickets just became available for event: {event.name}")
-                    newly_available_events.add(event.event_id)
+                for event in events_to_monitor:
+                    # Leave events to their timer while it is polling them
+                    burst = burst_tasks.get(event.event_id)
+                    if burst and not burst[0].done() and datetime.now() >= burst[1]:
+                        continue
+                    
+                    # Check the event
+                    async with check_locks[event.event_id]:
+                        was_available = event.tickets_available
+                        available = await self.check_event(event)
+                    
+                    # If tickets just became available
+                    if available and not was_available:
+                        logger.info(f"Tickets just became available for event: {event.name}")
+                        yield event
                     
-                    # Call notification callback if provided
-                    if notification_callback:
-                        try:
-                            notification_callback(event)
-                        except Exception as e:
-                            logger.error(f"Error in notification callback: {e}")
+                    # Brief pause between checks to avoid overloading the site
+                    async for found_event in self._drain_found(found, 2):
+                        yield found_event
                 
-                # Brief pause between checks to avoid overloading the site
-                await asyncio.sleep(2)
-            
-            if single_run:
-                break
-            
-            # Calculate remaining time to sleep
-            elapsed = time.time() - start_time
-            sleep_time = self.accelerated_interval if use_accelerated else self.interval
-            
-            if elapsed < sleep_time:
-                await asyncio.sleep(sleep_time - elapsed)
-        
-        # Return newly available events
-        return list(newly_available_events)
+                if single_run:
+                    break
+                
+                # Calculate remaining time to sleep
+                elapsed = time.time() - start_time
+                
+                async for found_event in self._drain_found(found, self.interval - elapsed):
+                    yield found_event
+        finally:
+            for task, _ in burst_tasks.values():
+                task.cancel()
 
 
 # Singleton instance
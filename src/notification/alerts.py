@@ -10,11 +10,15 @@ import json
 import smtplib
 import time
 import asyncio
-import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import aiohttp
+import orjson
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from email.message import EmailMessage
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable, Awaitable
 
 from ..config import config
 from ..utils.logger import get_logger
@@ -23,12 +27,389 @@ from ..monitoring.event_tracker import Event
 
 logger = get_logger(__name__)
 
+# Friendly names for notification event types
+_EVENT_NAMES = MappingProxyType({
+    "ticket_available": "Tickets Available",
+    "purchase_started": "Purchase Started",
+    "purchase_success": "Purchase Successful",
+    "purchase_failed": "Purchase Failed",
+    "error": "Error",
+    "digest": "Notification Digest"
+})
+
+# Priority markers for message bodies, email subjects and Slack attachments
+_PRIORITY_PREFIX = MappingProxyType({"high": "🔴 HIGH PRIORITY: ", "medium": "🟠 ", "low": ""})
+_PRIORITY_SUBJECT_PREFIX = MappingProxyType({"high": "🔴", "medium": "🟠", "low": ""})
+_SLACK_COLORS = MappingProxyType({"high": "#FF0000", "medium": "#FFA500", "low": "#008000"})
+
+# Ordering used to pick the most urgent priority in a digest
+_PRIORITY_RANK = MappingProxyType({"low": 0, "medium": 1, "high": 2})
+
+# Channels whose queued notifications are coalesced into a single digest
+_BATCHED_CHANNELS = frozenset({"email", "telegram"})
+
+# Separator between notifications in a digest
+_DIGEST_SEPARATOR = "\n\n---\n\n"
+
+# Headers for pre-serialized JSON request bodies
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# Formatted timestamp cache, refreshed at most once per second
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _now_str() -> str:
+    """
+    Get the current local time formatted for notifications.
+    
+    The formatted string only changes once per second, so it is cached
+    for the current second. A race between tasks can at worst return a
+    string that is one second stale.
+    
+    Returns:
+        Timestamp in YYYY-MM-DD HH:MM:SS format
+    """
+    global _last_ts_sec, _last_ts_str
+    
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _last_ts_sec = now
+    
+    return _last_ts_str
+
+
+def _event_name(event_type: str) -> str:
+    """
+    Get the friendly name for an event type.
+    
+    Args:
+        event_type: Type of event
+        
+    Returns:
+        Friendly event name
+    """
+    return _EVENT_NAMES.get(event_type) or event_type.replace("_", " ").title()
+
+
+def _message_header(event_type: str, priority: str) -> str:
+    """
+    Build the fixed header that starts a notification message.
+    
+    Args:
+        event_type: Type of event
+        priority: Priority level
+        
+    Returns:
+        Header text, ending just before the message
+    """
+    return f"{_PRIORITY_PREFIX.get(priority, '')}{_event_name(event_type)}: "
+
+
+def _email_subject(event_type: str, priority: str) -> str:
+    """
+    Build the email subject for an event type.
+    
+    Args:
+        event_type: Type of event
+        priority: Priority level
+        
+    Returns:
+        Email subject line
+    """
+    return f"{_PRIORITY_SUBJECT_PREFIX.get(priority, '')} BookMyShow Bot: {_event_name(event_type)}"
+
 
 class NotificationError(Exception):
     """Exception raised for notification errors."""
     pass
 
 
+class RateLimitError(NotificationError):
+    """Exception raised when a channel provider rejects a send with HTTP 429."""
+    
+    def __init__(self, channel: str, retry_after: float):
+        """
+        Initialize the error.
+        
+        Args:
+            channel: Channel that was rate limited
+            retry_after: Seconds to wait before retrying, as reported by the provider
+        """
+        super().__init__(f"{channel} rate limited, retry after {retry_after}s")
+        self.channel = channel
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter for outbound sends.
+    
+    Allows bursts of up to ``capacity`` sends, refilled at ``rate`` tokens per second.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+    
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        while True:
+            self._refill()
+            
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Block all sends for a period, e.g. after the provider returned HTTP 429.
+        
+        Args:
+            seconds: Time in seconds before the next token becomes available
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+
+class DedupCache:
+    """
+    Bounded LRU record of recently sent notification keys.
+    
+    Each key expires after its own TTL; the least recently seen keys are
+    evicted once ``maxsize`` is exceeded.
+    """
+    
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of keys to remember
+        """
+        self.maxsize = maxsize
+        self._expiry: "OrderedDict[Any, float]" = OrderedDict()
+    
+    def seen(self, key: Any, ttl: float) -> bool:
+        """
+        Check whether a key was seen within its TTL, recording it if not.
+        
+        Args:
+            key: Hashable notification key
+            ttl: Time in seconds the key stays suppressed once recorded
+            
+        Returns:
+            True if the key is a duplicate, False otherwise
+        """
+        now = time.monotonic()
+        expires_at = self._expiry.get(key)
+        
+        if expires_at is not None and expires_at > now:
+            self._expiry.move_to_end(key)
+            return True
+        
+        self._expiry[key] = now + ttl
+        self._expiry.move_to_end(key)
+        
+        while len(self._expiry) > self.maxsize:
+            self._expiry.popitem(last=False)
+        
+        return False
+
+
+@dataclass(slots=True)
+class ChannelConfig:
+    """Settings shared by every notification channel."""
+    
+    enabled: bool = False
+    rate_limit: float = 1.0
+    burst: float = 5
+    max_concurrent: int = 8
+    
+    @staticmethod
+    def _base_settings(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the shared channel settings from a configuration section.
+        
+        Args:
+            data: Channel configuration section
+            
+        Returns:
+            Keyword arguments for the shared fields
+        """
+        return {
+            "enabled": data.get("enabled", False),
+            "rate_limit": data.get("rate_limit", 1.0),
+            "burst": data.get("burst", 5),
+            "max_concurrent": data.get("max_concurrent", 8)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChannelConfig':
+        """
+        Create channel settings from a configuration section.
+        
+        Args:
+            data: Channel configuration section
+            
+        Returns:
+            ChannelConfig instance
+        """
+        return cls(**cls._base_settings(data))
+
+
+@dataclass(slots=True)
+class EmailConfig(ChannelConfig):
+    """Email channel settings."""
+    
+    smtp_server: str = ""
+    smtp_port: int = 587
+    use_tls: bool = True
+    timeout: float = 30
+    user: str = ""
+    password: str = ""
+    sender: str = ""
+    recipients: Tuple[str, ...] = ()
+    max_messages: int = 100
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EmailConfig':
+        """
+        Create email settings from a configuration section.
+        
+        Args:
+            data: Email channel configuration section
+            
+        Returns:
+            EmailConfig instance
+        """
+        user = data.get("smtp_user", "")
+        
+        return cls(
+            **cls._base_settings(data),
+            smtp_server=data.get("smtp_server", ""),
+            smtp_port=data.get("smtp_port", 587),
+            use_tls=data.get("use_tls", True),
+            timeout=data.get("timeout", 30),
+            user=user,
+            password=data.get("smtp_password", ""),
+            sender=data.get("from_address", user),
+            recipients=tuple(data.get("to_addresses", [])),
+            max_messages=data.get("smtp_max_messages", 100)
+        )
+
+
+@dataclass(slots=True)
+class TelegramConfig(ChannelConfig):
+    """Telegram channel settings."""
+    
+    bot_token: str = ""
+    chat_id: str = ""
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TelegramConfig':
+        """
+        Create Telegram settings from a configuration section.
+        
+        Args:
+            data: Telegram channel configuration section
+            
+        Returns:
+            TelegramConfig instance
+        """
+        return cls(
+            **cls._base_settings(data),
+            bot_token=data.get("bot_token", ""),
+            chat_id=str(data.get("chat_id", ""))
+        )
+
+
+@dataclass(slots=True)
+class SlackConfig(ChannelConfig):
+    """Slack channel settings."""
+    
+    webhook_url: str = ""
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SlackConfig':
+        """
+        Create Slack settings from a configuration section.
+        
+        Args:
+            data: Slack channel configuration section
+            
+        Returns:
+            SlackConfig instance
+        """
+        return cls(**cls._base_settings(data), webhook_url=data.get("webhook_url", ""))
+
+
+@dataclass(slots=True)
+class SmsConfig(ChannelConfig):
+    """SMS channel settings."""
+    
+    provider: str = ""
+    account_sid: str = ""
+    auth_token: str = ""
+    from_number: str = ""
+    to_numbers: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SmsConfig':
+        """
+        Create SMS settings from a configuration section.
+        
+        Args:
+            data: SMS channel configuration section
+            
+        Returns:
+            SmsConfig instance
+        """
+        return cls(
+            **cls._base_settings(data),
+            provider=data.get("provider", "").lower(),
+            account_sid=data.get("account_sid", ""),
+            auth_token=data.get("auth_token", ""),
+            from_number=data.get("from_number", ""),
+            to_numbers=tuple(data.get("to_numbers", []))
+        )
+
+
+@dataclass(slots=True)
+class EventRoute:
+    """Delivery settings for a notification event type."""
+    
+    channels: Tuple[str, ...] = ()
+    priority: str = "medium"
+    dedup_ttl: float = 60
+
+
+@dataclass(slots=True)
+class FormattedMessage:
+    """Notification text, formatted once and shared by every channel."""
+    
+    subject: str
+    body: str
+
+
 class NotificationManager:
     """
     Manages notifications for the BookMyShow Bot.
@@ -39,81 +420,469 @@ class NotificationManager:
     def __init__(self):
         """Initialize the notification manager."""
         # Load notification settings
-        self.channels = config.get("notification.channels", {})
-        self.events = config.get("notification.events", {})
+        self.reload_config()
+        
+        # Sender for each supported channel
+        self._channel_dispatch: Dict[str, Callable[..., Awaitable[bool]]] = {
+            "email": self._send_email,
+            "telegram": self._send_telegram,
+            "slack": self._send_slack,
+            "sms": self._send_sms
+        }
+        
+        # Suppress identical notifications sent within the dedup window
+        self._dedup = DedupCache(maxsize=4096)
+        
+        # Persistent SMTP session, reused across emails
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_sent = 0
+        self._smtp_lock = asyncio.Lock()
+        
+        # Shared HTTP session for Telegram/Slack/webhooks, created on first use
+        self._http: Optional[aiohttp.ClientSession] = None
+        
+        # Per-channel outbound queues, drained by rate-limited workers
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._in_flight: Dict[str, set] = {}
+    
+    def reload_config(self) -> None:
+        """Load notification settings into typed per-channel and per-event records."""
+        channels = config.get("notification.channels", {}) or {}
+        events = config.get("notification.events", {}) or {}
+        
+        # Retry policy for transient channel failures
+        self.max_retries = config.get("notification.max_retries", 3)
+        self.retry_delay = config.get("notification.retry_delay", 1.0)
+        self.dedup_ttl = config.get("notification.dedup_ttl", 60)
+        
+        # Digest batching for channels that support it
+        self.batch_window = config.get("notification.batch_window", 0.25)
+        self.max_batch = config.get("notification.max_batch", 10)
+        
+        # Channel settings
+        self.email_config = EmailConfig.from_dict(channels.get("email") or {})
+        self.telegram_config = TelegramConfig.from_dict(channels.get("telegram") or {})
+        self.slack_config = SlackConfig.from_dict(channels.get("slack") or {})
+        self.sms_config = SmsConfig.from_dict(channels.get("sms") or {})
+        
+        # Fixed email headers, stamped onto every message
+        self._email_headers: Dict[str, str] = {
+            "From": self.email_config.sender,
+            "To": ", ".join(self.email_config.recipients)
+        }
+        
+        known_configs = {
+            "email": self.email_config,
+            "telegram": self.telegram_config,
+            "slack": self.slack_config,
+            "sms": self.sms_config
+        }
+        self.channel_configs: Dict[str, ChannelConfig] = {
+            name: known_configs.get(name) or ChannelConfig.from_dict(data or {})
+            for name, data in channels.items()
+        }
+        
+        # Event routing
+        self.event_routes: Dict[str, EventRoute] = {
+            event_type: EventRoute(
+                channels=tuple(data.get("channels", [])),
+                priority=data.get("priority", "medium"),
+                dedup_ttl=data.get("dedup_ttl", self.dedup_ttl)
+            )
+            for event_type, data in events.items()
+        }
+        self._default_route = EventRoute(
+            channels=tuple(self.channel_configs),
+            priority="medium",
+            dedup_ttl=self.dedup_ttl
+        )
+        
+        # Static message headers and email subjects for each configured event
+        self._headers: Dict[Tuple[str, str], str] = {
+            (event_type, route.priority): _message_header(event_type, route.priority)
+            for event_type, route in self.event_routes.items()
+        }
+        self._subjects: Dict[Tuple[str, str], str] = {
+            (event_type, route.priority): _email_subject(event_type, route.priority)
+            for event_type, route in self.event_routes.items()
+        }
     
     async def send_notification(self, 
                              event_type: str, 
                              message: str, 
-                             details: Optional[Dict[str, Any]] = None) -> bool:
+                             details: Optional[Dict[str, Any]] = None, 
+                             dedup_key: Optional[Tuple] = None) -> bool:
         """
-        Send a notification for an event.
+        Send a notification for an event and wait for delivery.
         
         Args:
             event_type: Type of event (e.g., ticket_available, purchase_success)
             message: Main notification message
             details: Additional details for the notification
+            dedup_key: Identity of the notification for duplicate suppression;
+                defaults to a hash of the event type, message and details
             
         Returns:
             True if notification was sent successfully on any channel, False otherwise
         """
-        if event_type not in self.events:
+        pending = self._dispatch(event_type, message, details, dedup_key)
+        
+        if pending is None:
+            return True
+        
+        # Wait for delivery on all channels at once
+        results = await asyncio.gather(*(future for _, future in pending), return_exceptions=True)
+        return any(result is True for result in results)
+    
+    def _notify(self, 
+               event_type: str, 
+               message: str, 
+               details: Optional[Dict[str, Any]] = None, 
+               dedup_key: Optional[Tuple] = None) -> bool:
+        """
+        Queue a notification for background delivery without waiting for it.
+        
+        Args:
+            event_type: Type of event
+            message: Main notification message
+            details: Additional details for the notification
+            dedup_key: Identity of the notification for duplicate suppression
+            
+        Returns:
+            True if the notification was queued on any channel (or was a
+            duplicate of a recent one), False otherwise
+        """
+        pending = self._dispatch(event_type, message, details, dedup_key)
+        return pending is None or bool(pending)
+    
+    def _dispatch(self, 
+                 event_type: str, 
+                 message: str, 
+                 details: Optional[Dict[str, Any]] = None, 
+                 dedup_key: Optional[Tuple] = None) -> Optional[List[Tuple[str, asyncio.Future]]]:
+        """
+        Format a notification and queue it on each enabled channel.
+        
+        Args:
+            event_type: Type of event
+            message: Main notification message
+            details: Additional details for the notification
+            dedup_key: Identity of the notification for duplicate suppression
+            
+        Returns:
+            List of (channel, future) pairs for the queued sends, or None if the
+            notification was suppressed as a duplicate
+        """
+        route = self.event_routes.get(event_type)
+        
+        if route is None:
             logger.warning(f"Unknown event type: {event_type}")
-            event_channels = list(self.channels.keys())
-            priority = "medium"
-        else:
-            event_channels = self.events[event_type].get("channels", [])
-            priority = self.events[event_type].get("priority", "medium")
+            route = self._default_route
+        
+        dedup_ttl = route.dedup_ttl
+        
+        if dedup_ttl > 0:
+            if dedup_key is not None:
+                # Caller-supplied identity, no serialization needed
+                key = dedup_key
+            else:
+                digest = blake2b(digest_size=16)
+                digest.update(f"{event_type}|{message}|".encode())
+                digest.update(orjson.dumps(
+                    details, 
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, 
+                    default=str
+                ))
+                key = digest.digest()
+            
+            if self._dedup.seen(key, dedup_ttl):
+                logger.debug(f"Suppressing duplicate {event_type} notification")
+                return None
+        
+        event_channels = route.channels
+        priority = route.priority
         
         if not event_channels:
             logger.warning(f"No channels configured for event type: {event_type}")
-            return False
+            return []
         
-        # Format the full message
-        full_message = self._format_message(event_type, message, details, priority)
+        # Format the message once for all channels
+        formatted = self._format_message(event_type, message, details, priority)
         
-        # Send to each enabled channel
-        success = False
+        # Queue the message on each enabled channel
+        pending = []
         
         for channel in event_channels:
-            if channel not in self.channels:
+            channel_config = self.channel_configs.get(channel)
+            
+            if channel_config is None:
                 logger.warning(f"Unknown channel: {channel}")
                 continue
             
-            channel_config = self.channels[channel]
-            if not channel_config.get("enabled", False):
+            if not channel_config.enabled:
                 logger.debug(f"Channel {channel} is disabled")
                 continue
             
+            if channel not in self._channel_dispatch:
+                logger.warning(f"Unsupported channel: {channel}")
+                continue
+            
+            future = self._enqueue(channel, event_type, formatted, details, priority)
+            future.add_done_callback(lambda f, channel=channel: self._log_result(channel, f))
+            pending.append((channel, future))
+        
+        return pending
+        
+    def _log_result(self, channel: str, future: asyncio.Future) -> None:
+        """
+        Log the outcome of a queued send.
+        
+        Args:
+            channel: Channel the notification was sent on
+            future: Completed send future
+        """
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        
+        if error is not None:
+            logger.error(f"Error sending notification via {channel}: {str(error)}")
+        elif future.result():
+            logger.info(f"Notification sent via {channel}")
+        else:
+            logger.warning(f"Failed to send notification via {channel}")
+    
+    def _enqueue(self, 
+                channel: str, 
+                event_type: str, 
+                formatted: FormattedMessage, 
+                details: Optional[Dict[str, Any]], 
+                priority: str) -> asyncio.Future:
+        """
+        Queue a notification for delivery on a channel.
+        
+        Starts the channel's worker on first use.
+        
+        Args:
+            channel: Channel to send on
+            event_type: Type of event
+            formatted: Formatted notification subject and body
+            details: Additional details for the notification
+            priority: Priority level
+            
+        Returns:
+            Future resolved with the send result once the worker delivers it
+        """
+        queue = self._queues.get(channel)
+        
+        if queue is None:
+            queue = self._queues[channel] = asyncio.Queue()
+            self._workers[channel] = asyncio.create_task(self._worker(channel))
+        
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((event_type, formatted, details, priority, future))
+        return future
+    
+    async def _worker(self, channel: str) -> None:
+        """
+        Deliver queued notifications for a channel.
+        
+        Sends are paced by a token bucket configured with the channel's
+        ``rate_limit`` (sends per second) and ``burst`` settings, and at most
+        ``max_concurrent`` sends are in flight at once. On email and Telegram,
+        notifications arriving within ``batch_window`` seconds of each other
+        are sent as one digest.
+        
+        Args:
+            channel: Channel to deliver on
+        """
+        queue = self._queues[channel]
+        channel_config = self.channel_configs.get(channel) or ChannelConfig()
+        bucket = TokenBucket(rate=channel_config.rate_limit, capacity=channel_config.burst)
+        semaphore = asyncio.BoundedSemaphore(max(1, channel_config.max_concurrent))
+        in_flight = self._in_flight.setdefault(channel, set())
+        batched = channel in _BATCHED_CHANNELS
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await queue.get()]
+            
             try:
-                if channel == "email":
-                    result = await self._send_email(event_type, full_message, details, priority)
-                elif channel == "telegram":
-                    result = await self._send_telegram(event_type, full_message, details, priority)
-                elif channel == "slack":
-                    result = await self._send_slack(event_type, full_message, details, priority)
-                elif channel == "sms":
-                    result = await self._send_sms(event_type, full_message, details, priority)
-                else:
-                    logger.warning(f"Unsupported channel: {channel}")
-                    result = False
+                if batched:
+                    deadline = loop.time() + self.batch_window
+                    
+                    while len(batch) < self.max_batch:
+                        if not queue.empty():
+                            batch.append(queue.get_nowait())
+                            continue
+                        
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        
+                        try:
+                            batch.append(await asyncio.wait_for(queue.get(), remaining))
+                        except asyncio.TimeoutError:
+                            break
                 
-                if result:
-                    logger.info(f"Notification sent via {channel}")
-                    success = True
-                else:
-                    logger.warning(f"Failed to send notification via {channel}")
+                # Wait for a free send slot, then deliver in the background
+                await semaphore.acquire()
+            except asyncio.CancelledError:
+                # Closing; fail the notifications taken off the queue so far
+                self._fail_batch(queue, batch)
+                raise
+            
+            task = asyncio.create_task(self._deliver_batch(channel, bucket, queue, batch))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            task.add_done_callback(lambda _: semaphore.release())
+    
+    async def _deliver_batch(self, 
+                             channel: str, 
+                             bucket: TokenBucket, 
+                             queue: asyncio.Queue, 
+                             batch: List[Tuple]) -> None:
+        """
+        Send a batch of queued notifications and resolve their futures.
+        
+        Transient failures are retried with exponential backoff. When the
+        provider answers with HTTP 429 the whole channel is paused for the
+        requested time and the notifications are re-queued.
+        
+        Args:
+            channel: Channel to deliver on
+            bucket: Rate limiter for the channel
+            queue: Channel queue the batch was taken from
+            batch: Queued (event_type, formatted, details, priority, future) items
+        """
+        event_type, formatted, details, priority = self._merge_batch(batch)
+        
+        try:
+            result = await self._send_with_retry(
+                bucket, channel, event_type, formatted, details, priority
+            )
+        except RateLimitError as e:
+            logger.warning(f"{channel} rate limited, pausing for {e.retry_after}s")
+            bucket.pause(e.retry_after)
+            for item in batch:
+                queue.put_nowait(item)
+        except asyncio.CancelledError:
+            # Closing; don't leave senders waiting on a delivery that won't happen
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(NotificationError("Notification manager closed"))
+            raise
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            for _ in batch:
+                queue.task_done()
+    
+    def _fail_batch(self, queue: asyncio.Queue, batch: List[Tuple]) -> None:
+        """
+        Fail queued notifications that will not be delivered because of shutdown.
+        
+        Args:
+            queue: Channel queue the batch was taken from
+            batch: Queued (event_type, formatted, details, priority, future) items
+        """
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(NotificationError("Notification manager closed"))
+            queue.task_done()
+    
+    def get_channel_load(self) -> Dict[str, int]:
+        """
+        Get the number of sends currently in flight on each channel.
+        
+        Returns:
+            Dictionary mapping channel name to in-flight send count
+        """
+        return {channel: len(tasks) for channel, tasks in self._in_flight.items()}
+    
+    def _merge_batch(self, batch: List[Tuple]) -> Tuple[str, FormattedMessage, Optional[Dict[str, Any]], str]:
+        """
+        Combine queued notifications into a single send.
+        
+        Args:
+            batch: Queued (event_type, formatted, details, priority, future) items
+            
+        Returns:
+            Tuple of (event_type, formatted, details, priority) to send
+        """
+        if len(batch) == 1:
+            event_type, formatted, details, priority, _ = batch[0]
+            return event_type, formatted, details, priority
+        
+        event_types = {item[0] for item in batch}
+        event_type = event_types.pop() if len(event_types) == 1 else "digest"
+        priority = max((item[3] for item in batch), key=lambda p: _PRIORITY_RANK.get(p, 0))
+        formatted = FormattedMessage(
+            subject=self._subjects.get((event_type, priority)) or _email_subject(event_type, priority),
+            body=_DIGEST_SEPARATOR.join(item[1].body for item in batch)
+        )
+        
+        return event_type, formatted, None, priority
+    
+    async def _send_with_retry(self, 
+                              bucket: TokenBucket, 
+                              channel: str, 
+                              event_type: str, 
+                              formatted: FormattedMessage, 
+                              details: Optional[Dict[str, Any]], 
+                              priority: str) -> bool:
+        """
+        Send a notification, retrying transient failures with exponential backoff.
+        
+        No delay is taken after the final attempt; its error is raised directly.
+        
+        Args:
+            bucket: Rate limiter for the channel
+            channel: Channel to send on
+            event_type: Type of event
+            formatted: Formatted notification subject and body
+            details: Additional details for the notification
+            priority: Priority level
+            
+        Returns:
+            True if sent successfully, False otherwise
+            
+        Raises:
+            RateLimitError: If the provider rate limited the send
+            NotificationError: If every attempt failed with a transient error
+        """
+        attempts = max(1, self.max_retries)
+        
+        for attempt in range(attempts):
+            await bucket.acquire()
+            
+            try:
+                return await self._channel_dispatch[channel](event_type, formatted, details, priority)
+            except RateLimitError:
+                raise
+            except NotificationError as e:
+                if attempt == attempts - 1:
+                    raise
                 
-            except Exception as e:
-                logger.error(f"Error sending notification via {channel}: {str(e)}")
+                delay = self.retry_delay * (2 ** attempt)
+                logger.warning(f"Transient error on {channel} ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
         
-        return success
+        return False
     
     def _format_message(self, 
                       event_type: str, 
                       message: str, 
                       details: Optional[Dict[str, Any]] = None, 
-                      priority: str = "medium") -> str:
+                      priority: str = "medium") -> FormattedMessage:
         """
         Format a notification message.
         
@@ -124,45 +893,31 @@ class NotificationManager:
             priority: Priority level
             
         Returns:
-            Formatted message
-        """
-        # Convert event type to friendly name
-        event_names = {
-            "ticket_available": "Tickets Available",
-            "purchase_started": "Purchase Started",
-            "purchase_success": "Purchase Successful",
-            "purchase_failed": "Purchase Failed",
-            "error": "Error"
-        }
-        
-        event_name = event_names.get(event_type, event_type.replace("_", " ").title())
-        
-        # Priority indicator
-        priority_indicators = {
-            "high": "🔴 HIGH PRIORITY: ",
-            "medium": "🟠 ",
-            "low": ""
-        }
-        
-        priority_prefix = priority_indicators.get(priority, "")
+            Formatted subject and body
+        """
+        # Event name with priority indicator, precomputed for configured events
+        header = self._headers.get((event_type, priority)) or _message_header(event_type, priority)
         
         # Timestamp
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _now_str()
         
         # Basic message
-        formatted = f"{priority_prefix}{event_name}: {message}\n\nTime: {timestamp}"
+        parts = [header + message, "", f"Time: {timestamp}"]
         
         # Add details if provided
         if details:
-            formatted += "\n\nDetails:"
-            for key, value in details.items():
-                formatted += f"\n- {key}: {value}"
+            parts.append("")
+            parts.append("Details:")
+            parts.extend(f"- {key}: {value}" for key, value in details.items())
+        
+        # Subject with priority indicator, precomputed for configured events
+        subject = self._subjects.get((event_type, priority)) or _email_subject(event_type, priority)
         
-        return formatted
+        return FormattedMessage(subject=subject, body="\n".join(parts))
     
     async def _send_email(self, 
                         event_type: str, 
-                        message: str, 
+                        formatted: FormattedMessage, 
                         details: Optional[Dict[str, Any]] = None, 
                         priority: str = "medium") -> bool:
         """
@@ -170,74 +925,179 @@ class NotificationManager:
         
         Args:
             event_type: Type of event
-            message: Formatted notification message
+            formatted: Formatted notification subject and body
             details: Additional details for the notification
             priority: Priority level
             
         Returns:
             True if sent successfully, False otherwise
         """
-        email_config = self.channels.get("email", {})
-        if not email_config.get("enabled", False):
+        email_config = self.email_config
+        if not email_config.enabled:
             return False
         
-        # Get email settings
-        smtp_server = email_config.get("smtp_server", "")
-        smtp_port = email_config.get("smtp_port", 587)
-        use_tls = email_config.get("use_tls", True)
-        username = email_config.get("smtp_user", "")
-        password = email_config.get("smtp_password", "")
-        sender = email_config.get("from_address", username)
-        recipients = email_config.get("to_addresses", [])
-        
-        if not smtp_server or not username or not password or not recipients:
+        if (not email_config.smtp_server or not email_config.user 
+                or not email_config.password or not email_config.recipients):
             logger.warning("Incomplete email configuration")
             return False
         
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg["From"] = sender
-            msg["To"] = ", ".join(recipients)
-            
-            # Subject with priority indicator
-            priority_indicators = {"high": "🔴", "medium": "🟠", "low": ""}
-            priority_prefix = priority_indicators.get(priority, "")
-            
-            event_names = {
-                "ticket_available": "Tickets Available",
-                "purchase_started": "Purchase Started",
-                "purchase_success": "Purchase Successful",
-                "purchase_failed": "Purchase Failed",
-                "error": "Error"
-            }
-            event_name = event_names.get(event_type, event_type.replace("_", " ").title())
+            # Create message from the precomputed headers
+            msg = EmailMessage()
+            for header, value in self._email_headers.items():
+                msg[header] = value
             
-            msg["Subject"] = f"{priority_prefix} BookMyShow Bot: {event_name}"
+            # Subject and body, formatted once in send_notification
+            msg["Subject"] = formatted.subject
+            msg.set_content(formatted.body)
             
-            # Add message body
-            msg.attach(MIMEText(message, "plain"))
+            # Send over the persistent session without blocking the event loop
+            async with self._smtp_lock:
+                await asyncio.to_thread(self._deliver_email, msg, email_config)
             
-            # Connect to server and send
-            smtp = smtplib.SMTP(smtp_server, smtp_port)
-            
-            if use_tls:
-                smtp.starttls()
-            
-            smtp.login(username, password)
-            smtp.send_message(msg)
-            smtp.quit()
-            
-            logger.info(f"Email notification sent to {len(recipients)} recipients")
+            logger.info(f"Email notification sent to {len(email_config.recipients)} recipients")
             return True
             
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError) as e:
+            raise NotificationError(f"Email delivery failed: {str(e)}") from e
         except Exception as e:
             logger.error(f"Error sending email notification: {str(e)}")
             return False
     
+    def _open_smtp(self, email_config: EmailConfig) -> smtplib.SMTP:
+        """
+        Open and authenticate a new SMTP session.
+        
+        Args:
+            email_config: Email channel settings
+            
+        Returns:
+            Authenticated SMTP session
+        """
+        smtp = smtplib.SMTP(
+            email_config.smtp_server,
+            email_config.smtp_port,
+            timeout=email_config.timeout
+        )
+        
+        if email_config.use_tls:
+            smtp.starttls()
+        
+        smtp.login(email_config.user, email_config.password)
+        return smtp
+    
+    def _close_smtp(self) -> None:
+        """Close the persistent SMTP session if one is open."""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except Exception:
+            # The server may already have dropped the connection
+            self._smtp.close()
+        
+        self._smtp = None
+        self._smtp_sent = 0
+    
+    def _deliver_email(self, msg: EmailMessage, email_config: EmailConfig) -> None:
+        """
+        Send an email over the persistent SMTP session.
+        
+        The session is opened on first use and recycled after
+        ``smtp_max_messages`` emails or when the server disconnects.
+        Runs in a worker thread; callers must hold ``_smtp_lock``.
+        
+        Args:
+            msg: Message to send
+            email_config: Email channel settings
+        """
+        if self._smtp is None or self._smtp_sent >= email_config.max_messages:
+            self._close_smtp()
+            self._smtp = self._open_smtp(email_config)
+        
+        try:
+            try:
+                self._smtp.send_message(msg, to_addrs=email_config.recipients)
+            except smtplib.SMTPServerDisconnected:
+                # Idle session was dropped by the server, reconnect once
+                self._smtp = self._open_smtp(email_config)
+                self._smtp_sent = 0
+                self._smtp.send_message(msg, to_addrs=email_config.recipients)
+        except Exception:
+            # Never reuse a session left in an unknown state
+            self._close_smtp()
+            raise
+        
+        self._smtp_sent += 1
+    
+    def _get_http(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it if needed.
+        
+        Returns:
+            Pooled aiohttp client session
+        """
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(limit=128, limit_per_host=64, ttl_dns_cache=300)
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        
+        return self._http
+    
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for all queued notifications to be delivered.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+        """
+        queues = list(self._queues.values())
+        
+        try:
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in queues)), timeout)
+        except asyncio.TimeoutError:
+            pending = sum(queue.qsize() for queue in queues)
+            logger.warning(f"Timed out draining notifications, {pending} still queued")
+    
+    async def close(self) -> None:
+        """
+        Stop channel workers and close persistent connections.
+        
+        Notifications still queued or being sent are failed, so nothing is
+        left waiting on them.
+        """
+        tasks = list(self._workers.values())
+        for in_flight in self._in_flight.values():
+            tasks.extend(in_flight)
+        for task in tasks:
+            task.cancel()
+        
+        # Let the cancelled tasks fail the notifications they were holding
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for queue in self._queues.values():
+            remaining = []
+            while not queue.empty():
+                remaining.append(queue.get_nowait())
+            self._fail_batch(queue, remaining)
+        
+        self._workers.clear()
+        self._in_flight.clear()
+        self._queues.clear()
+        
+        async with self._smtp_lock:
+            await asyncio.to_thread(self._close_smtp)
+        
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+    
     async def _send_telegram(self, 
                            event_type: str, 
-                           message: str, 
+                           formatted: FormattedMessage, 
                            details: Optional[Dict[str, Any]] = None, 
                            priority: str = "medium") -> bool:
         """
@@ -245,49 +1105,61 @@ class NotificationManager:
         
         Args:
             event_type: Type of event
-            message: Formatted notification message
+            formatted: Formatted notification subject and body
             details: Additional details for the notification
             priority: Priority level
             
         Returns:
             True if sent successfully, False otherwise
         """
-        telegram_config = self.channels.get("telegram", {})
-        if not telegram_config.get("enabled", False):
+        telegram_config = self.telegram_config
+        if not telegram_config.enabled:
             return False
         
-        bot_token = telegram_config.get("bot_token", "")
-        chat_id = telegram_config.get("chat_id", "")
-        
-        if not bot_token or not chat_id:
+        if not telegram_config.bot_token or not telegram_config.chat_id:
             logger.warning("Incomplete Telegram configuration")
             return False
         
         try:
             # Send message
-            api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+            api_url = f"https://api.telegram.org/bot{telegram_config.bot_token}/sendMessage"
             payload = {
-                "chat_id": chat_id,
-                "text": message,
+                "chat_id": telegram_config.chat_id,
+                "text": formatted.body,
                 "parse_mode": "Markdown"
             }
             
-            response = requests.post(api_url, json=payload)
-            
-            if response.status_code == 200:
-                logger.info("Telegram notification sent")
-                return True
-            else:
-                logger.warning(f"Telegram API returned: {response.status_code} - {response.text}")
+            async with self._get_http().post(
+                api_url, data=orjson.dumps(payload), headers=_JSON_HEADERS
+            ) as response:
+                if response.status == 200:
+                    logger.info("Telegram notification sent")
+                    return True
+                
+                if response.status == 429:
+                    data = await response.json(content_type=None)
+                    retry_after = data.get("parameters", {}).get("retry_after", 1)
+                    raise RateLimitError("telegram", float(retry_after))
+                
+                body = await response.text()
+                
+                if response.status >= 500:
+                    raise NotificationError(f"Telegram API returned: {response.status} - {body}")
+                
+                logger.warning(f"Telegram API returned: {response.status} - {body}")
                 return False
                 
+        except NotificationError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise NotificationError(f"Telegram request failed: {str(e)}") from e
         except Exception as e:
             logger.error(f"Error sending Telegram notification: {str(e)}")
             return False
     
     async def _send_slack(self, 
                         event_type: str, 
-                        message: str, 
+                        formatted: FormattedMessage, 
                         details: Optional[Dict[str, Any]] = None, 
                         priority: str = "medium") -> bool:
         """
@@ -295,58 +1167,69 @@ class NotificationManager:
         
         Args:
             event_type: Type of event
-            message: Formatted notification message
+            formatted: Formatted notification subject and body
             details: Additional details for the notification
             priority: Priority level
             
         Returns:
             True if sent successfully, False otherwise
         """
-        slack_config = self.channels.get("slack", {})
-        if not slack_config.get("enabled", False):
+        slack_config = self.slack_config
+        if not slack_config.enabled:
             return False
         
-        webhook_url = slack_config.get("webhook_url", "")
-        
-        if not webhook_url:
+        if not slack_config.webhook_url:
             logger.warning("Incomplete Slack configuration")
             return False
         
         try:
             # Color coding by priority
-            colors = {"high": "#FF0000", "medium": "#FFA500", "low": "#008000"}
-            color = colors.get(priority, "#808080")
+            color = _SLACK_COLORS.get(priority, "#808080")
             
             # Create payload
             payload = {
                 "attachments": [
                     {
-                        "fallback": message,
+                        "fallback": formatted.body,
                         "color": color,
                         "pretext": "BookMyShow Bot Notification",
                         "title": event_type.replace("_", " ").title(),
-                        "text": message,
+                        "text": formatted.body,
                         "ts": time.time()
                     }
                 ]
             }
             
-            response = requests.post(webhook_url, json=payload)
-            
-            if response.status_code == 200:
-                logger.info("Slack notification sent")
-                return True
-            else:
-                logger.warning(f"Slack API returned: {response.status_code} - {response.text}")
+            async with self._get_http().post(
+                slack_config.webhook_url, data=orjson.dumps(payload), headers=_JSON_HEADERS
+            ) as response:
+                if response.status == 200:
+                    logger.info("Slack notification sent")
+                    return True
+                
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After", "1")
+                    raise RateLimitError("slack", float(retry_after))
+                
+                body = await response.text()
+                
+                if response.status >= 500:
+                    raise NotificationError(f"Slack API returned: {response.status} - {body}")
+                
+                logger.warning(f"Slack API returned: {response.status} - {body}")
                 return False
                 
+        except NotificationError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise NotificationError(f"Slack request failed: {str(e)}") from e
         except Exception as e:
             logger.error(f"Error sending Slack notification: {str(e)}")
             return False
     
     async def _send_sms(self, 
                       event_type: str, 
-                      message: str, 
+                      formatted: FormattedMessage, 
                       details: Optional[Dict[str, Any]] = None, 
                       priority: str = "medium") -> bool:
         """
@@ -354,72 +1237,120 @@ class NotificationManager:
         
         Args:
             event_type: Type of event
-            message: Formatted notification message
+            formatted: Formatted notification subject and body
             details: Additional details for the notification
             priority: Priority level
             
         Returns:
             True if sent successfully, False otherwise
-            
-        Note:
-            This is a placeholder for SMS integration.
         """
-        sms_config = self.channels.get("sms", {})
-        if not sms_config.get("enabled", False):
+        sms_config = self.sms_config
+        if not sms_config.enabled:
             return False
         
-        provider = sms_config.get("provider", "").lower()
-        
-        if provider == "twilio":
-            return await self._send_twilio_sms(message, sms_config)
+        if sms_config.provider == "twilio":
+            return await self._send_twilio_sms(formatted.body, sms_config)
         else:
-            logger.warning(f"Unsupported SMS provider: {provider}")
+            logger.warning(f"Unsupported SMS provider: {sms_config.provider}")
             return False
     
-    async def _send_twilio_sms(self, message: str, sms_config: Dict[str, Any]) -> bool:
+    async def _send_twilio_sms(self, message: str, sms_config: SmsConfig) -> bool:
         """
-        Send SMS via Twilio.
+        Send SMS via the Twilio REST API.
+        
+        Messages to all recipients are sent concurrently over the shared
+        HTTP session.
         
         Args:
             message: Message to send
-            sms_config: SMS configuration
+            sms_config: SMS channel settings
             
         Returns:
-            True if sent successfully, False otherwise
+            True if sent to at least one recipient, False otherwise
             
-        Note:
-            This is a placeholder for Twilio integration.
+        Raises:
+            RateLimitError: If no recipient was reached and Twilio rate limited a send
+            NotificationError: If no recipient was reached because of a transient error
         """
-        account_sid = sms_config.get("account_sid", "")
-        auth_token = sms_config.get("auth_token", "")
-        from_number = sms_config.get("from_number", "")
-        to_numbers = sms_config.get("to_numbers", [])
-        
-        if not account_sid or not auth_token or not from_number or not to_numbers:
+        if (not sms_config.account_sid or not sms_config.auth_token 
+                or not sms_config.from_number or not sms_config.to_numbers):
             logger.warning("Incomplete Twilio configuration")
             return False
         
-        try:
-            # Shorten message for SMS
-            if len(message) > 160:
-                short_message = message[:157] + "..."
-            else:
-                short_message = message
-            
-            # Send to each number
-            success = False
-            
-            for to_number in to_numbers:
-                # Note: This is a placeholder for actual Twilio API integration
-                # In a real implementation, this would use the Twilio SDK
-                logger.info(f"Would send SMS to {to_number}: {short_message}")
-                success = True
+        # Shorten message for SMS
+        if len(message) > 160:
+            short_message = message[:157] + "..."
+        else:
+            short_message = message
+        
+        api_url = f"https://api.twilio.com/2010-04-01/Accounts/{sms_config.account_sid}/Messages.json"
+        auth = aiohttp.BasicAuth(sms_config.account_sid, sms_config.auth_token)
+        
+        # Send to each number
+        results = await asyncio.gather(
+            *(self._post_twilio_sms(api_url, auth, sms_config.from_number, to_number, short_message)
+              for to_number in sms_config.to_numbers),
+            return_exceptions=True
+        )
+        
+        if any(result is True for result in results):
+            return True
+        
+        # Surface rate limits first so the worker pauses, then transient errors for retry
+        for error_type in (RateLimitError, NotificationError):
+            for result in results:
+                if isinstance(result, error_type):
+                    raise result
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error sending Twilio SMS: {str(result)}")
+        
+        return False
+    
+    async def _post_twilio_sms(self, 
+                               api_url: str, 
+                               auth: aiohttp.BasicAuth, 
+                               from_number: str, 
+                               to_number: str, 
+                               body: str) -> bool:
+        """
+        Send a single SMS through the Twilio REST API.
+        
+        Args:
+            api_url: Twilio Messages endpoint for the account
+            auth: Account credentials
+            from_number: Sender phone number
+            to_number: Recipient phone number
+            body: Message text
             
-            return success
+        Returns:
+            True if Twilio accepted the message, False otherwise
+        """
+        data = {"From": from_number, "To": to_number, "Body": body}
+        
+        try:
+            async with self._get_http().post(api_url, data=data, auth=auth) as response:
+                if response.status in (200, 201):
+                    logger.info(f"SMS sent to {to_number}")
+                    return True
                 
-        except Exception as e:
-            logger.error(f"Error sending Twilio SMS: {str(e)}")
-            return False
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After", "1")
+                    raise RateLimitError("sms", float(retry_after))
+                
+                response_text = await response.text()
+                
+                if response.status >= 500:
+                    raise NotificationError(f"Twilio API returned: {response.status} - {response_text}")
+                
+                logger.warning(f"Twilio API returned: {response.status} - {response_text}")
+                return False
+                
+        except NotificationError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise NotificationError(f"Twilio request failed: {str(e)}") from e
     
     async def notify_ticket_available(self, event: Event) -> bool:
         """
@@ -429,7 +1360,7 @@ class NotificationManager:
             event: Event with available tickets
             
         Returns:
-            True if notification was sent successfully, False otherwise
+            True if the notification was queued for delivery, False otherwise
         """
         message = f"Tickets are now available for '{event.name}'!"
         
@@ -440,7 +1371,7 @@ class NotificationManager:
             "Date": event.event_date or "Unknown date"
         }
         
-        return await self.send_notification("ticket_available", message, details)
+        return self._notify("ticket_available", message, details, ("ticket_available", event.url))
     
     async def notify_purchase_started(self, event: Event, quantity: int) -> bool:
         """
@@ -451,7 +1382,7 @@ class NotificationManager:
             quantity: Number of tickets being purchased
             
         Returns:
-            True if notification was sent successfully, False otherwise
+            True if the notification was queued for delivery, False otherwise
         """
         message = f"Starting purchase of {quantity} tickets for '{event.name}'."
         
@@ -463,7 +1394,7 @@ class NotificationManager:
             "Date": event.event_date or "Unknown date"
         }
         
-        return await self.send_notification("purchase_started", message, details)
+        return self._notify("purchase_started", message, details, ("purchase_started", event.url, quantity))
     
     async def notify_purchase_success(self, 
                                      event: Event, 
@@ -478,7 +1409,7 @@ class NotificationManager:
             total_price: Total price paid
             
         Returns:
-            True if notification was sent successfully, False otherwise
+            True if the notification was queued for delivery, False otherwise
         """
         message = f"Successfully purchased {quantity} tickets for '{event.name}'!"
         
@@ -491,7 +1422,7 @@ class NotificationManager:
             "Date": event.event_date or "Unknown date"
         }
         
-        return await self.send_notification("purchase_success", message, details)
+        return self._notify("purchase_success", message, details, ("purchase_success", event.url, quantity))
     
     async def notify_purchase_failed(self, event: Event, error_message: str) -> bool:
         """
@@ -502,7 +1433,7 @@ class NotificationManager:
             error_message: Error message explaining the failure
             
         Returns:
-            True if notification was sent successfully, False otherwise
+            True if the notification was queued for delivery, False otherwise
         """
         message = f"Failed to purchase tickets for '{event.name}'."
         
@@ -514,7 +1445,7 @@ class NotificationManager:
             "Date": event.event_date or "Unknown date"
         }
         
-        return await self.send_notification("purchase_failed", message, details)
+        return self._notify("purchase_failed", message, details, ("purchase_failed", event.url, error_message))
     
     async def notify_error(self, error_message: str, context: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -525,11 +1456,11 @@ class NotificationManager:
             context: Additional context about the error
             
         Returns:
-            True if notification was sent successfully, False otherwise
+            True if the notification was queued for delivery, False otherwise
         """
         message = f"Error in BookMyShow Bot: {error_message}"
         
-        return await self.send_notification("error", message, context)
+        return self._notify("error", message, context)
 
 
 # Singleton instance
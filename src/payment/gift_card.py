@@ -5,49 +5,83 @@ This module handles all aspects of payment processing, with a focus on
 gift card payments for faster checkout without additional authentication.
 """
 
+import os
+import sys
 import re
-import json
-import time
+import logging
+import bisect
 import random
+import asyncio
+import threading
+import orjson
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Tuple, Any, Union, Sequence, ClassVar
 
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from ..config import config
 from ..utils.logger import get_logger
 from ..utils.browser_manager import browser_manager
+from ..utils.browser_helpers import first_visible
 
 
 logger = get_logger(__name__)
 
+# Rupee amount, e.g. "₹ 1,250.00"
+_AMOUNT_RE = re.compile(r'₹\s*([\d,]+(?:\.\d+)?)')
+
+# Collects every rupee amount in the page text, so only the matches leave the browser
+_PAGE_AMOUNTS_JS = r"""
+() => {
+    const text = document.body ? document.body.innerText : "";
+    return Array.from(text.matchAll(/₹\s*([\d,]+(?:\.\d+)?)/g), (match) => match[1]);
+}
+"""
+
 
 class PaymentError(Exception):
     """Exception raised for payment errors."""
     pass
 
 
+def _combine_selectors(selectors: Sequence[str]) -> str:
+    """
+    Combine selectors into one that matches a visible element of any of them.
+    
+    Playwright ``text=`` selectors are rewritten as ``:text()`` pseudo-classes
+    so the whole set fits into a single CSS selector list, which is resolved
+    in one browser round trip.
+    
+    Args:
+        selectors: CSS or ``text=`` selectors
+        
+    Returns:
+        Combined selector
+    """
+    parts = [
+        f':text("{selector[5:]}")' if selector.startswith("text=") else selector
+        for selector in selectors
+    ]
+    return ", ".join(parts) + " >> visible=true"
+
+
+@dataclass(slots=True)
 class GiftCard:
     """Represents a BookMyShow gift card."""
     
-    def __init__(self, 
-                card_number: str, 
-                pin: str, 
-                balance: float = 0.0, 
-                last_used: Optional[str] = None):
-        """
-        Initialize a gift card.
-        
-        Args:
-            card_number: Gift card number
-            pin: Gift card PIN
-            balance: Current balance (if known)
-            last_used: ISO format timestamp when last used
-        """
-        self.card_number = card_number
-        self.pin = pin
-        self.balance = balance
-        self.last_used = last_used
+    card_number: str
+    pin: str = field(repr=False)
+    balance: float = 0.0
+    last_used: Optional[str] = None  # ISO format timestamp when last used
+    mask: str = field(init=False, repr=False, compare=False)  # Last four digits, for logs
+    
+    def __post_init__(self) -> None:
+        """Intern the card number and cache its masked form."""
+        # Interned so index lookups and comparisons can short-circuit on identity
+        self.card_number = sys.intern(self.card_number)
+        self.mask = self.card_number[-4:]
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -90,6 +124,60 @@ class PaymentProcessor:
     and manages the checkout process.
     """
     
+    # Offers section
+    _OFFER_SELECTORS: ClassVar[Tuple[str, ...]] = (
+        ".offers-section",
+        ".available-offers",
+        ".promocode-section",
+        "text=Apply Promocode"
+    )
+    
+    _OFFER_SECTION: ClassVar[str] = _combine_selectors(_OFFER_SELECTORS)
+    
+    # Gift card payment option
+    _GIFT_CARD_SELECTORS: ClassVar[Tuple[str, ...]] = (
+        "text=Gift Card",
+        "text=BookMyShow Gift Card",
+        ".payment-gift-card",
+        "label:has-text('Gift Card')"
+    )
+    _GIFT_CARD_OPTION: ClassVar[str] = _combine_selectors(_GIFT_CARD_SELECTORS)
+    
+    # Payment submit buttons
+    _SUBMIT_SELECTORS: ClassVar[Tuple[str, ...]] = (
+        "button:has-text('Pay')",
+        "button:has-text('Submit')",
+        "button[type='submit']",
+        "input[type='submit']"
+    )
+    
+    # Payment amount elements
+    _AMOUNT_SELECTORS: ClassVar[Tuple[str, ...]] = (
+        ".total-amount",
+        ".grand-total",
+        ".payment-amount",
+        "text=/Total Amount: ₹[\\d,.]+/"
+    )
+    
+    # Payment success indicators
+    _SUCCESS_SELECTORS: ClassVar[Tuple[str, ...]] = (
+        "text=Payment Successful",
+        "text=Booking Confirmed",
+        "text=Your transaction is successful",
+        ".success-message",
+        ".confirmation-message"
+    )
+    _SUCCESS_INDICATOR: ClassVar[str] = _combine_selectors(_SUCCESS_SELECTORS)
+    
+    # Payment failure indicators
+    _FAILURE_SELECTORS: ClassVar[Tuple[str, ...]] = (
+        "text=Payment Failed",
+        "text=Transaction Failed",
+        ".failure-message",
+        ".error-message"
+    )
+    _FAILURE_INDICATOR: ClassVar[str] = _combine_selectors(_FAILURE_SELECTORS)
+    
     def __init__(self):
         """Initialize the payment processor."""
         self.payment_method = config.get("payment.method", "gift_card")
@@ -102,58 +190,152 @@ class PaymentProcessor:
         
         # Load gift cards if available
         self.gift_cards: List[GiftCard] = []
-        self._load_gift_cards()
+        self._load_gift_cards_sync()
+        
+        # Index of gift cards by card number
+        self._by_number: Dict[str, GiftCard] = {card.card_number: card for card in self.gift_cards}
+        
+        # Gift cards ordered by balance, with their balances, for best-fit lookup
+        self._sorted_cards: List[GiftCard] = sorted(self.gift_cards, key=lambda c: c.balance)
+        self._sorted_balances: List[float] = [card.balance for card in self._sorted_cards]
+        
+        # Set when cards change; written out by flush()
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        
+        # Payment amounts scraped during the current payment, by page URL
+        self._amount_cache: Dict[str, float] = {}
     
-    def _load_gift_cards(self) -> None:
+    def _load_gift_cards_sync(self) -> None:
         """Load gift cards from disk."""
         if not self.gift_cards_path.exists():
             logger.info("No gift cards file found")
             return
         
         try:
-            with open(self.gift_cards_path, "r") as f:
-                gift_card_data = json.load(f)
+            gift_card_data = orjson.loads(self.gift_cards_path.read_bytes())
             
             self.gift_cards = [GiftCard.from_dict(data) for data in gift_card_data]
             logger.info(f"Loaded {len(self.gift_cards)} gift cards")
         except Exception as e:
             logger.error(f"Error loading gift cards: {str(e)}")
     
-    def _save_gift_cards(self) -> None:
-        """Save gift cards to disk."""
+    def _serialize_gift_cards(self) -> bytes:
+        """
+        Serialize all gift cards to JSON.
+        
+        Cards are encoded straight from the list through to_dict(), without
+        building an intermediate list of dictionaries.
+        
+        Returns:
+            JSON document as bytes
+        """
+        return orjson.dumps(
+            self.gift_cards, 
+            default=GiftCard.to_dict, 
+            option=orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    
+    def _save_gift_cards_sync(self, payload: Optional[bytes] = None) -> None:
+        """
+        Save gift cards to disk, replacing the file atomically.
+        
+        Args:
+            payload: Serialized gift cards to write, defaults to the current cards
+        """
         try:
-            gift_card_data = [card.to_dict() for card in self.gift_cards]
+            if payload is None:
+                payload = self._serialize_gift_cards()
             
-            with open(self.gift_cards_path, "w") as f:
-                json.dump(gift_card_data, f, indent=2)
+            tmp_path = self.gift_cards_path.with_suffix(".tmp")
             
-            logger.debug(f"Saved {len(self.gift_cards)} gift cards")
+            with self._save_lock:
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, self.gift_cards_path)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Saved {len(self.gift_cards)} gift cards")
         except Exception as e:
             logger.error(f"Error saving gift cards: {str(e)}")
     
+    async def _save_gift_cards_async(self) -> None:
+        """Save gift cards to disk without blocking the event loop."""
+        # Serialize on the event loop so cards can't change mid-write
+        payload = self._serialize_gift_cards()
+        await asyncio.to_thread(self._save_gift_cards_sync, payload)
+    
+    @staticmethod
+    def _now_iso() -> str:
+        """
+        Get the current UTC time as an ISO 8601 timestamp.
+        
+        Returns:
+            Timestamp such as 2024-01-31T18:30:00Z
+        """
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    def flush(self) -> None:
+        """Save gift cards to disk if they changed since the last save."""
+        if self._dirty:
+            self._save_gift_cards_sync()
+            self._dirty = False
+    
     def add_gift_card(self, card_number: str, pin: str, balance: float = 0.0) -> None:
         """
         Add a gift card to the system.
         
+        The change is written to disk on the next flush().
+        
         Args:
             card_number: Gift card number
             pin: Gift card PIN
             balance: Current balance (if known)
         """
         # Check if card already exists
-        for card in self.gift_cards:
-            if card.card_number == card_number:
-                card.pin = pin
-                card.balance = balance
-                logger.info(f"Updated existing gift card ending in ...{card_number[-4:]}")
-                self._save_gift_cards()
-                return
+        card = self._by_number.get(card_number)
+        if card:
+            card.pin = pin
+            self._set_balance(card, balance)
+            logger.info(f"Updated existing gift card ending in ...{card.mask}")
+            self._dirty = True
+            return
         
         # Add new card
         card = GiftCard(card_number=card_number, pin=pin, balance=balance)
         self.gift_cards.append(card)
-        logger.info(f"Added new gift card ending in ...{card_number[-4:]}")
-        self._save_gift_cards()
+        self._by_number[card_number] = card
+        self._index_balance(card)
+        logger.info(f"Added new gift card ending in ...{card.mask}")
+        self._dirty = True
+    
+    def _index_balance(self, card: GiftCard) -> None:
+        """
+        Insert a gift card into the balance-ordered index.
+        
+        Args:
+            card: Gift card to insert
+        """
+        index = bisect.bisect_right(self._sorted_balances, card.balance)
+        self._sorted_balances.insert(index, card.balance)
+        self._sorted_cards.insert(index, card)
+    
+    def _set_balance(self, card: GiftCard, balance: float) -> None:
+        """
+        Change a gift card's balance, keeping the balance-ordered index in step.
+        
+        Args:
+            card: Gift card to update
+            balance: New balance
+        """
+        index = bisect.bisect_left(self._sorted_balances, card.balance)
+        while self._sorted_cards[index] is not card:
+            index += 1
+        
+        del self._sorted_balances[index]
+        del self._sorted_cards[index]
+        
+        card.balance = balance
+        self._index_balance(card)
     
     def get_gift_cards_with_balance(self) -> List[GiftCard]:
         """
@@ -166,21 +348,22 @@ class PaymentProcessor:
     
     def update_gift_card_balance(self, card_number: str, balance: float) -> None:
         """
-        Update the balance of a gift card.
+        Update the balance of a gift card and save it.
         
         Args:
             card_number: Gift card number
             balance: New balance
         """
-        for card in self.gift_cards:
-            if card.card_number == card_number:
-                card.balance = balance
-                card.last_used = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                logger.info(f"Updated balance for gift card ...{card_number[-4:]}: ₹{balance:.2f}")
-                self._save_gift_cards()
-                return
+        card = self._by_number.get(card_number)
+        if not card:
+            logger.warning(f"Gift card ...{card_number[-4:]} not found")
+            return
         
-        logger.warning(f"Gift card ...{card_number[-4:]} not found")
+        self._set_balance(card, balance)
+        card.last_used = self._now_iso()
+        logger.info(f"Updated balance for gift card ...{card.mask}: ₹{balance:.2f}")
+        self._dirty = True
+        self.flush()
     
     async def process_payment(self, page: Page) -> bool:
         """
@@ -193,17 +376,19 @@ class PaymentProcessor:
             True if payment was successful, False otherwise
         """
         logger.info("Starting payment process")
+        payment_method = self.payment_method
+        
+        # Apply offers if configured, alongside payment method selection
+        offers_task = asyncio.create_task(self._apply_offers(page)) if self.apply_offers else None
         
         try:
-            # Apply offers if configured
-            if self.apply_offers:
-                await self._apply_offers(page)
-            
             # Choose payment method
-            if self.payment_method == "gift_card":
-                success = await self._pay_with_gift_card(page)
+            if payment_method == "gift_card":
+                success = await self._pay_with_gift_card(page, offers_task)
             else:
-                logger.warning(f"Payment method {self.payment_method} not fully implemented")
+                logger.warning(f"Payment method {payment_method} not fully implemented")
+                if offers_task:
+                    await offers_task
                 success = await self._pay_with_default_method(page)
             
             if not success:
@@ -217,6 +402,16 @@ class PaymentProcessor:
         except Exception as e:
             logger.error(f"Error during payment: {str(e)}")
             return False
+        
+        finally:
+            if offers_task and not offers_task.done():
+                offers_task.cancel()
+            
+            # Persist card changes made during this payment in one write
+            if self._dirty:
+                self._dirty = False
+                await self._save_gift_cards_async()
+            self._amount_cache.clear()
     
     async def _apply_offers(self, page: Page) -> bool:
         """
@@ -232,49 +427,48 @@ class PaymentProcessor:
         
         try:
             # Check for offers section
-            offer_selectors = [
-                ".offers-section",
-                ".available-offers",
-                ".promocode-section",
-                "text=Apply Promocode"
-            ]
-            
-            for selector in offer_selectors:
-                if await page.is_visible(selector, timeout=3000):
-                    logger.info("Found offers section")
-                    
-                    # Check for available offers
-                    offer_items = await page.query_selector_all(".offer-item, .promocode-item")
-                    if offer_items:
-                        logger.info(f"Found {len(offer_items)} available offers")
-                        
-                        # Apply first offer
-                        await offer_items[0].click()
-                        await browser_manager.random_delay()
-                        
-                        # Look for apply button
-                        apply_button = await page.query_selector("button:has-text('Apply'), button.apply-btn")
-                        if apply_button:
-                            await apply_button.click()
-                            await browser_manager.random_delay()
-                            logger.info("Applied offer")
-                            return True
-                    else:
-                        logger.info("No offers available")
-            
-            logger.info("No offers section found")
+            try:
+                await page.locator(self._OFFER_SECTION).first.wait_for(state="visible", timeout=3000)
+            except PlaywrightTimeoutError:
+                logger.info("No offers section found")
+                return False
+            
+            logger.info("Found offers section")
+            
+            # Check for available offers
+            offer_items = await page.query_selector_all(".offer-item, .promocode-item")
+            if not offer_items:
+                logger.info("No offers available")
+                return False
+            
+            logger.info(f"Found {len(offer_items)} available offers")
+            
+            # Apply first offer
+            await offer_items[0].click()
+            await browser_manager.random_delay()
+            
+            # Look for apply button
+            apply_button = await page.query_selector("button:has-text('Apply'), button.apply-btn")
+            if apply_button:
+                await apply_button.click()
+                await browser_manager.random_delay()
+                logger.info("Applied offer")
+                return True
+            
             return False
             
         except Exception as e:
             logger.warning(f"Error applying offers: {str(e)}")
             return False
     
-    async def _pay_with_gift_card(self, page: Page) -> bool:
+    async def _pay_with_gift_card(self, page: Page, offers_task: Optional[asyncio.Task] = None) -> bool:
         """
         Pay using gift card.
         
         Args:
             page: Page object
+            offers_task: Pending offer application, awaited before the payment
+                amount is read since offers can change it
             
         Returns:
             True if payment was initiated successfully, False otherwise
@@ -287,23 +481,20 @@ class PaymentProcessor:
         
         try:
             # Select gift card payment option
-            gift_card_selectors = [
-                "text=Gift Card",
-                "text=BookMyShow Gift Card",
-                ".payment-gift-card",
-                "label:has-text('Gift Card')"
-            ]
-            
-            for selector in gift_card_selectors:
-                if await page.is_visible(selector, timeout=3000):
-                    await browser_manager.click(page, selector)
-                    logger.info("Selected gift card payment option")
-                    await browser_manager.random_delay()
-                    break
-            else:
+            try:
+                await page.locator(self._GIFT_CARD_OPTION).first.wait_for(state="visible", timeout=3000)
+            except PlaywrightTimeoutError:
                 logger.warning("Gift card payment option not found")
                 return False
             
+            await browser_manager.click(page, self._GIFT_CARD_OPTION)
+            logger.info("Selected gift card payment option")
+            await browser_manager.random_delay()
+            
+            # Let offers finish applying before reading the amount
+            if offers_task:
+                await offers_task
+            
             # Get the required payment amount
             amount = await self._get_payment_amount(page)
             if amount <= 0:
@@ -322,7 +513,8 @@ class PaymentProcessor:
             
             if await page.is_visible(card_number_selector, timeout=3000):
                 await browser_manager.type(page, card_number_selector, card.card_number)
-                logger.debug(f"Entered gift card number ending in ...{card.card_number[-4:]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Entered gift card number ending in ...{card.mask}")
             else:
                 logger.warning("Gift card number field not found")
                 return False
@@ -335,26 +527,22 @@ class PaymentProcessor:
                 return False
             
             # Submit payment
-            submit_selectors = [
-                "button:has-text('Pay')",
-                "button:has-text('Submit')",
-                "button[type='submit']",
-                "input[type='submit']"
-            ]
-            
-            for selector in submit_selectors:
-                if await page.is_visible(selector, timeout=3000):
-                    await browser_manager.click(page, selector)
-                    logger.info(f"Submitted payment with gift card ...{card.card_number[-4:]}")
-                    
-                    # Update card usage timestamp
-                    card.last_used = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                    self._save_gift_cards()
-                    
-                    return True
+            selector = await first_visible(page, self._SUBMIT_SELECTORS, 3000)
+            if not selector:
+                logger.warning("Payment submission button not found")
+                return False
             
-            logger.warning("Payment submission button not found")
-            return False
+            await browser_manager.click(page, selector)
+            logger.info(f"Submitted payment with gift card ...{card.mask}")
+            
+            # Update card usage timestamp
+            card.last_used = self._now_iso()
+            self._dirty = True
+            
+            # The amount no longer applies once payment is submitted
+            self._amount_cache.clear()
+            
+            return True
             
         except Exception as e:
             logger.error(f"Error processing gift card payment: {str(e)}")
@@ -403,42 +591,42 @@ class PaymentProcessor:
         """
         Get the payment amount from the page.
         
+        The amount is cached per page URL until the payment is submitted.
+        
         Args:
             page: Page object
             
         Returns:
             Payment amount as float
         """
+        cached = self._amount_cache.get(page.url)
+        if cached:
+            return cached
+        
         try:
             # Try different selectors for payment amount
-            amount_selectors = [
-                ".total-amount",
-                ".grand-total",
-                ".payment-amount",
-                "text=/Total Amount: ₹[\\d,.]+/"
-            ]
-            
-            for selector in amount_selectors:
+            for selector in self._AMOUNT_SELECTORS:
                 amount_element = await page.query_selector(selector)
                 if amount_element:
                     amount_text = await amount_element.text_content()
-                    amount_match = re.search(r'₹\s*([\d,]+(\.\d+)?)', amount_text)
+                    amount_match = _AMOUNT_RE.search(amount_text)
                     
                     if amount_match:
                         amount_str = amount_match.group(1).replace(',', '')
                         amount = float(amount_str)
                         logger.info(f"Payment amount: ₹{amount:.2f}")
+                        self._amount_cache[page.url] = amount
                         return amount
             
             # If no amount found with specific selectors, try to find any currency amount
-            page_text = await page.text_content()
-            amount_matches = re.findall(r'₹\s*([\d,]+(\.\d+)?)', page_text)
+            amount_matches = await page.evaluate(_PAGE_AMOUNTS_JS)
             
             if amount_matches:
                 # Use the largest amount found
-                amounts = [float(match[0].replace(',', '')) for match in amount_matches]
+                amounts = [float(match.replace(',', '')) for match in amount_matches]
                 max_amount = max(amounts)
                 logger.info(f"Found payment amount from text: ₹{max_amount:.2f}")
+                self._amount_cache[page.url] = max_amount
                 return max_amount
             
             logger.warning("Could not find payment amount")
@@ -458,17 +646,18 @@ class PaymentProcessor:
         Returns:
             GiftCard with sufficient balance, or None if not found
         """
+        balances = self._sorted_balances
+        
         # If we don't know balances, just return the first card
-        unknown_balance_cards = [card for card in self.gift_cards if card.balance == 0]
-        if unknown_balance_cards:
+        index = bisect.bisect_left(balances, 0)
+        if index < len(balances) and balances[index] == 0:
             logger.info("Using gift card with unknown balance")
-            return unknown_balance_cards[0]
+            return self._sorted_cards[index]
         
-        # Find cards with sufficient balance
-        sufficient_cards = [card for card in self.gift_cards if card.balance >= amount]
-        if sufficient_cards:
-            # Use the card with the smallest sufficient balance
-            card = min(sufficient_cards, key=lambda c: c.balance)
+        # Use the card with the smallest sufficient balance
+        index = bisect.bisect_left(balances, amount)
+        if index < len(balances):
+            card = self._sorted_cards[index]
             logger.info(f"Using gift card with balance ₹{card.balance:.2f} for payment of ₹{amount:.2f}")
             return card
         
@@ -484,45 +673,24 @@ class PaymentProcessor:
         Returns:
             True if payment was confirmed, False otherwise
         """
-        logger.info(f"Waiting for payment confirmation (timeout: {self.payment_timeout}s)")
-        
-        start_time = time.time()
+        timeout = self.payment_timeout
+        logger.info(f"Waiting for payment confirmation (timeout: {timeout}s)")
         
         try:
-            # Check for success indicators
-            success_selectors = [
-                "text=Payment Successful",
-                "text=Booking Confirmed",
-                "text=Your transaction is successful",
-                ".success-message",
-                ".confirmation-message"
-            ]
-            
-            # Check for failure indicators
-            failure_selectors = [
-                "text=Payment Failed",
-                "text=Transaction Failed",
-                ".failure-message",
-                ".error-message"
-            ]
-            
-            while time.time() - start_time < self.payment_timeout:
-                # Check for success
-                for selector in success_selectors:
-                    if await page.is_visible(selector, timeout=1000):
-                        logger.info(f"Payment confirmed: {selector}")
-                        return True
-                
-                # Check for failure
-                for selector in failure_selectors:
-                    if await page.is_visible(selector, timeout=1000):
-                        logger.error(f"Payment failed: {selector}")
-                        return False
-                
-                # Wait before checking again
-                await page.wait_for_timeout(2000)
+            # Wait for whichever outcome appears first
+            indicator = await first_visible(
+                page, (self._SUCCESS_INDICATOR, self._FAILURE_INDICATOR), timeout * 1000
+            )
+            
+            if indicator == self._SUCCESS_INDICATOR:
+                logger.info("Payment confirmed")
+                return True
+            
+            if indicator == self._FAILURE_INDICATOR:
+                logger.error("Payment failed")
+                return False
             
-            logger.warning(f"Payment confirmation timed out after {self.payment_timeout}s")
+            logger.warning(f"Payment confirmation timed out after {timeout}s")
             return False
             
         except Exception as e:
@@ -5,19 +5,23 @@ This module orchestrates the complete ticket purchase flow from monitoring
 to payment, handling all the steps in the process.
 """
 
+import re
+import random
 import asyncio
 import time
+import orjson
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
 from ..config import config
 from ..utils.logger import get_logger
 from ..utils.browser_manager import browser_manager
 from ..utils.captcha_solver import captcha_solver
-from ..utils.proxy_manager import proxy_manager
+from ..utils.proxy_manager import Proxy, proxy_manager
 from ..monitoring.event_tracker import Event
 from ..auth.login import auth_manager
 from ..ticket.selector import ticket_selector
@@ -27,12 +31,98 @@ from ..notification.alerts import notification_manager
 
 logger = get_logger(__name__)
 
+# Errors that another attempt can't fix
+_HARD_FAILURES = ("sold out",)
+
+# Upper bound on the exponential part of the retry delay, in seconds
+_MAX_RETRY_DELAY = 60
+
+# Change in page size, in characters, that counts as a new page state
+_PAGE_CHANGE_THRESHOLD = 500
+
+# CAPTCHA solves to observe for an event before trusting its solve rate
+_MIN_CAPTCHA_SAMPLES = 3
+
+# Booking detail patterns
+_ID_RE = re.compile(r'([A-Z0-9]{5,})')
+_AMOUNT_RE = re.compile(r'₹\s*([\d,]+(?:\.\d+)?)')
+_DATE_RE = re.compile(r'(\d{1,2}\s+[A-Za-z]{3}|\d{1,2}/\d{1,2}/\d{2,4})')
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))')
+
+# Where to find each booking detail on the confirmation page. CSS selectors
+# are tried in order, then the page text is searched for the given phrases
+# and patterns. "visible" fields only count rendered elements, and "match"
+# fields only count elements whose text matches the pattern.
+_BOOKING_FIELDS = {
+    "confirmation": {
+        "css": [".success-message", ".confirmation-message"],
+        "texts": ["Booking Confirmed", "Your transaction is successful"],
+        "visible": True
+    },
+    "id": {
+        "css": [".booking-id", "[data-id='booking-id']", ".confirmation-id"],
+        "patterns": ["Booking ID: [A-Z0-9]+"]
+    },
+    "name": {
+        "css": [".event-name", ".movie-name", "h1", ".heading-name"]
+    },
+    "amount": {
+        "css": [".total-amount", ".amount-paid"],
+        "match": "₹\\s*[\\d,]+",
+        "patterns": ["Total: ₹[\\d,.]+", "Amount Paid: ₹[\\d,.]+"]
+    },
+    "venue": {
+        "css": [".venue-name", ".theatre-name", "[data-id='venue']"]
+    },
+    "date": {
+        "css": [".date-time", ".show-date", ".show-time", "[data-id='show-date']", "[data-id='show-time']"]
+    }
+}
+
+# Looks up every booking field in the page at once, returning the matched text per field
+_BOOKING_DETAILS_JS = """
+(fields) => {
+    const text = document.body ? document.body.innerText : "";
+    const lower = text.toLowerCase();
+    const pick = ({css = [], texts = [], patterns = [], visible = false, match = null}) => {
+        const accept = match ? new RegExp(match) : null;
+        for (const selector of css) {
+            const element = document.querySelector(selector);
+            if (element && (!visible || element.getClientRects().length > 0) &&
+                    (!accept || accept.test(element.textContent))) {
+                return element.textContent.trim();
+            }
+        }
+        for (const phrase of texts) {
+            if (lower.includes(phrase.toLowerCase())) return phrase;
+        }
+        for (const pattern of patterns) {
+            const match = text.match(new RegExp(pattern));
+            if (match) return match[0];
+        }
+        return null;
+    };
+    const found = {};
+    for (const [name, field] of Object.entries(fields)) found[name] = pick(field);
+    return found;
+}
+"""
+
 
 class PurchaseFlowError(Exception):
     """Exception raised for purchase flow errors."""
     pass
 
 
+@dataclass(slots=True)
+class PurchaseState:
+    """Progress of a purchase for one event."""
+    
+    start_time: float
+    status: str = "starting"
+    end_time: Optional[float] = None
+
+
 class PurchaseFlow:
     """
     Orchestrates the complete ticket purchase flow.
@@ -47,9 +137,40 @@ class PurchaseFlow:
         self.retry_delay = config.get("purchase.retry_delay", 5)
         self.screenshot_dir = Path(config.get("purchase.screenshot_dir", "data/screenshots"))
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        self.screenshots_enabled = config.get("purchase.screenshots_enabled", True)
+        self.screenshot_format = config.get("purchase.screenshot_format", "jpeg")
+        self.screenshot_quality = config.get("purchase.screenshot_quality", 50)
+        self.bookings_dir = Path("data/bookings")
+        self.bookings_dir.mkdir(parents=True, exist_ok=True)
+        self.skip_idempotent_captcha_probe = config.get("purchase.skip_idempotent_captcha_probe", True)
+        self.captcha_attempt_budget = config.get("purchase.captcha_attempt_budget", 2.5)
+        
+        # CAPTCHA (successes, attempts) by event
+        self._captcha_stats: Dict[str, Tuple[int, int]] = {}
+        
+        # Events whose last attempt gave up on a CAPTCHA
+        self._captcha_failed: Set[str] = set()
+        
+        # Login credentials, read once from config
+        self._credentials = self._build_credentials()
+        
+        # Screenshot directories that already exist
+        self._known_dirs: Set[Path] = set()
+        
+        # Screenshots still being written, by page
+        self._screenshot_tasks: Dict[Page, List[asyncio.Task]] = {}
         
         # Track ongoing purchases
-        self.active_purchases = {}
+        self.active_purchases: Dict[str, PurchaseState] = {}
+        
+        # Held by the purchase running for each event
+        self._event_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Limit how many purchases drive the browser at once
+        self._purchase_slots = asyncio.Semaphore(config.get("purchase.max_concurrent", 3))
+        
+        # Browser context per event, reused across purchase attempts
+        self._contexts: Dict[str, BrowserContext] = {}
     
     async def execute_purchase(self, event: Event, quantity: Optional[int] = None) -> bool:
         """
@@ -63,102 +184,165 @@ class PurchaseFlow:
             True if purchase was successful, False otherwise
         """
         # Check if there's already a purchase in progress for this event
-        if event.event_id in self.active_purchases:
+        lock = self._event_locks.setdefault(event.event_id, asyncio.Lock())
+        if lock.locked() or event.event_id in self.active_purchases:
             logger.warning(f"Purchase already in progress for event: {event.name}")
             return False
         
-        # Mark purchase as active
-        self.active_purchases[event.event_id] = {
-            "start_time": time.time(),
-            "status": "starting"
-        }
+        async with lock:
+            # Mark purchase as active
+            state = PurchaseState(start_time=time.time())
+            self.active_purchases[event.event_id] = state
+            
+            # Use event's quantity if not specified
+            if quantity is None:
+                quantity = event.quantity
+            
+            logger.info(f"Starting purchase flow for '{event.name}', {quantity} tickets")
+            
+            # Notify about purchase start
+            await notification_manager.notify_purchase_started(event, quantity)
+            
+            # Start with fresh purchase attempt
+            attempt = 1
+            error = None
+            
+            try:
+                # Wait for a free purchase slot
+                async with self._purchase_slots:
+                    while attempt <= self.max_retries:
+                        logger.info(f"Purchase attempt {attempt}/{self.max_retries}")
+                        state.status = f"attempt_{attempt}"
+                        
+                        try:
+                            success = await self._execute_purchase_attempt(
+                                event, quantity, last_attempt=attempt == self.max_retries
+                            )
+                        
+                            if success:
+                                logger.info(f"Purchase successful for '{event.name}'!")
+                                state.status = "completed"
+                                return True
+                        
+                            logger.warning(f"Purchase attempt {attempt} failed for '{event.name}'")
+                        
+                        except Exception as e:
+                            logger.error(f"Error during purchase attempt {attempt}: {str(e)}")
+                            error = str(e)
+                            
+                            if any(failure in error.lower() for failure in _HARD_FAILURES):
+                                logger.warning(f"Not retrying purchase for '{event.name}': {error}")
+                                break
+                        
+                        # Increment attempt and back off exponentially, with jitter
+                        # so retries don't land on the same rate-limit or CAPTCHA state
+                        attempt += 1
+                        if attempt <= self.max_retries:
+                            delay = min(self.retry_delay * (2 ** (attempt - 2)), _MAX_RETRY_DELAY)
+                            delay += random.uniform(0, self.retry_delay)
+                            logger.info(f"Waiting {delay:.1f} seconds before next attempt")
+                            await asyncio.sleep(delay)
+                    
+                    # All attempts failed
+                    attempts = min(attempt, self.max_retries)
+                    logger.error(f"All purchase attempts failed for '{event.name}'")
+                    await notification_manager.notify_purchase_failed(
+                        event, 
+                        f"Failed after {attempts} attempts: {error or 'Unknown error'}"
+                    )
+                    
+                    state.status = "failed"
+                    return False
+                
+            finally:
+                # Clean up
+                await self._close_context(event.event_id)
+                self._captcha_failed.discard(event.event_id)
+                
+                state.end_time = time.time()
+                
+                self._event_locks.pop(event.event_id, None)
+    
+    async def _get_context(self, event_id: str, proxy: Optional[Proxy] = None) -> BrowserContext:
+        """
+        Get the browser context for an event, creating it on first use.
         
-        # Use event's quantity if not specified
-        if quantity is None:
-            quantity = event.quantity
+        Args:
+            event_id: ID of the event being purchased
+            proxy: Proxy to route a newly created context through
+            
+        Returns:
+            Browser context
+        """
+        context = self._contexts.get(event_id)
         
-        logger.info(f"Starting purchase flow for '{event.name}', {quantity} tickets")
+        if context is None:
+            context = await browser_manager.create_context(
+                load_session=True,
+                session_id="bookmyshow",
+                proxy=proxy.playwright_config if proxy else None
+            )
+            self._contexts[event_id] = context
         
-        # Notify about purchase start
-        await notification_manager.notify_purchase_started(event, quantity)
+        return context
+    
+    async def _close_context(self, event_id: str) -> None:
+        """
+        Close and forget the browser context for an event.
         
-        # Start with fresh purchase attempt
-        attempt = 1
-        error = None
+        Args:
+            event_id: ID of the event
+        """
+        context = self._contexts.pop(event_id, None)
         
-        try:
-            while attempt <= self.max_retries:
-                logger.info(f"Purchase attempt {attempt}/{self.max_retries}")
-                self.active_purchases[event.event_id]["status"] = f"attempt_{attempt}"
-                
-                try:
-                    success = await self._execute_purchase_attempt(event, quantity)
-                    
-                    if success:
-                        logger.info(f"Purchase successful for '{event.name}'!")
-                        self.active_purchases[event.event_id]["status"] = "completed"
-                        return True
-                    
-                    logger.warning(f"Purchase attempt {attempt} failed for '{event.name}'")
-                    
-                except Exception as e:
-                    logger.error(f"Error during purchase attempt {attempt}: {str(e)}")
-                    error = str(e)
-                
-                # Increment attempt and wait before retry
-                attempt += 1
-                if attempt <= self.max_retries:
-                    delay = self.retry_delay * attempt
-                    logger.info(f"Waiting {delay} seconds before next attempt")
-                    await asyncio.sleep(delay)
-            
-            # All attempts failed
-            logger.error(f"All purchase attempts failed for '{event.name}'")
-            await notification_manager.notify_purchase_failed(
-                event, 
-                f"Failed after {self.max_retries} attempts: {error or 'Unknown error'}"
-            )
-            
-            self.active_purchases[event.event_id]["status"] = "failed"
-            return False
-            
-        finally:
-            # Clean up
-            if event.event_id in self.active_purchases:
-                self.active_purchases[event.event_id]["end_time"] = time.time()
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser context: {str(e)}")
     
-    async def _execute_purchase_attempt(self, event: Event, quantity: int) -> bool:
+    async def _execute_purchase_attempt(self, event: Event, quantity: int, last_attempt: bool = False) -> bool:
         """
         Execute a single purchase attempt.
         
         Args:
             event: Event to purchase tickets for
             quantity: Number of tickets to purchase
+            last_attempt: Whether no retry will follow this attempt
             
         Returns:
             True if purchase was successful, False otherwise
         """
-        # Create a new browser context with proxy if enabled
-        proxy = await proxy_manager.get_proxy() if proxy_manager.enabled else None
+        # After a failed CAPTCHA, start over on a new proxy and context for
+        # a fresh CAPTCHA draw
+        rotate = event.event_id in self._captcha_failed
+        self._captcha_failed.discard(event.event_id)
         
-        context_options = {
-            "load_session": True, 
-            "session_id": "bookmyshow"
-        }
+        # Get a proxy if enabled
+        proxy = await proxy_manager.get_proxy(force_rotation=rotate) if proxy_manager.enabled else None
         
         if proxy:
             logger.info(f"Using proxy: {proxy.host}:{proxy.port}")
-            # The browser_manager will apply proxy settings when creating context
         
-        context = await browser_manager.create_context(**context_options)
-        page = await browser_manager.new_page(context)
+        if rotate:
+            logger.info("Recycling browser context after CAPTCHA failure")
+            await self._close_context(event.event_id)
+        
+        # Reuse the event's browser context, replacing it if it has crashed
+        context = await self._get_context(event.event_id, proxy)
+        
+        try:
+            page = await browser_manager.new_page(context)
+        except Exception as e:
+            logger.warning(f"Browser context unusable, recreating: {str(e)}")
+            await self._close_context(event.event_id)
+            context = await self._get_context(event.event_id, proxy)
+            page = await browser_manager.new_page(context)
+        
+        # Screenshot directory for this attempt, created with the first screenshot
+        attempt_screenshot_dir = self.screenshot_dir / f"{event.event_id}_{int(time.time())}"
         
         try:
-            # Set up screenshot directory for this attempt
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            attempt_screenshot_dir = self.screenshot_dir / f"{event.event_id}_{timestamp}"
-            attempt_screenshot_dir.mkdir(parents=True, exist_ok=True)
-            
             # Step 1: Navigate to event page
             logger.info(f"Navigating to event: {event.url}")
             await browser_manager.navigate(page, event.url)
@@ -180,16 +364,28 @@ class PurchaseFlow:
             logger.info("Checking for CAPTCHA")
             has_captcha, _ = await captcha_solver.detect_captcha(page)
             if has_captcha:
+                if not last_attempt and self._captcha_over_budget(event.event_id):
+                    logger.warning("CAPTCHA unlikely to be solved, moving on to the next attempt")
+                    await self._take_screenshot(page, attempt_screenshot_dir, "04_captcha_skipped")
+                    self._captcha_failed.add(event.event_id)
+                    return False
+                
                 logger.info("CAPTCHA detected, attempting to solve")
                 captcha_solved = await captcha_solver.solve_captcha(page)
+                self._record_captcha_result(event.event_id, captcha_solved)
                 if not captcha_solved:
                     logger.error("Failed to solve CAPTCHA")
                     await self._take_screenshot(page, attempt_screenshot_dir, "04_captcha_failed")
+                    self._mark_captcha_failed(event.event_id, proxy)
                     return False
                 await self._take_screenshot(page, attempt_screenshot_dir, "04_captcha_solved")
             
             # Step 5: Select tickets
             logger.info(f"Selecting {quantity} tickets")
+            before_selection = None
+            if self.skip_idempotent_captcha_probe:
+                before_selection = await self._page_fingerprint(page)
+            
             # Update quantity in the selector
             ticket_selector.desired_quantity = quantity
             
@@ -201,15 +397,30 @@ class PurchaseFlow:
             
             await self._take_screenshot(page, attempt_screenshot_dir, "05_tickets_selected")
             
-            # Step 6: Check for CAPTCHA again after ticket selection
-            logger.info("Checking for CAPTCHA after ticket selection")
-            has_captcha, _ = await captcha_solver.detect_captcha(page)
+            # Step 6: Check for CAPTCHA again after ticket selection, unless
+            # the page hasn't changed since the last check
+            if (self.skip_idempotent_captcha_probe and
+                    not self._page_changed(before_selection, await self._page_fingerprint(page))):
+                logger.info("Page unchanged after ticket selection, skipping CAPTCHA check")
+                has_captcha = False
+            else:
+                logger.info("Checking for CAPTCHA after ticket selection")
+                has_captcha, _ = await captcha_solver.detect_captcha(page)
+            
             if has_captcha:
+                if not last_attempt and self._captcha_over_budget(event.event_id):
+                    logger.warning("CAPTCHA unlikely to be solved, moving on to the next attempt")
+                    await self._take_screenshot(page, attempt_screenshot_dir, "06_captcha_skipped")
+                    self._captcha_failed.add(event.event_id)
+                    return False
+                
                 logger.info("CAPTCHA detected after ticket selection, attempting to solve")
                 captcha_solved = await captcha_solver.solve_captcha(page)
+                self._record_captcha_result(event.event_id, captcha_solved)
                 if not captcha_solved:
                     logger.error("Failed to solve CAPTCHA after ticket selection")
                     await self._take_screenshot(page, attempt_screenshot_dir, "06_captcha_failed")
+                    self._mark_captcha_failed(event.event_id, proxy)
                     return False
                 await self._take_screenshot(page, attempt_screenshot_dir, "06_captcha_solved")
             
@@ -229,9 +440,10 @@ class PurchaseFlow:
             
             if booking_details and booking_details.get("confirmation_id"):
                 logger.info(f"Booking confirmed! ID: {booking_details['confirmation_id']}")
+                
                 await self._take_screenshot(page, attempt_screenshot_dir, "08_booking_confirmed")
                 
-                # Save booking details
+                # Save booking details while the screenshot is written
                 await self._save_booking_details(event, booking_details, attempt_screenshot_dir)
                 
                 # Send success notification
@@ -253,8 +465,113 @@ class PurchaseFlow:
             raise
             
         finally:
-            # Close browser context
-            await context.close()
+            # Let pending screenshots finish, then close the page, keeping the
+            # context warm for the next attempt
+            await self._wait_for_screenshots(page)
+            self._known_dirs.discard(attempt_screenshot_dir)
+            
+            try:
+                await page.close()
+            except Exception as e:
+                logger.debug(f"Error closing page: {str(e)}")
+    
+    async def _page_fingerprint(self, page: Page) -> Tuple[str, int]:
+        """
+        Get a cheap fingerprint of the page's current state.
+        
+        Args:
+            page: Page to fingerprint
+            
+        Returns:
+            Tuple of (url, document size), with a size of -1 if it couldn't be read
+        """
+        try:
+            size = await page.evaluate("document.documentElement.outerHTML.length")
+        except Exception as e:
+            logger.debug(f"Error reading page size: {str(e)}")
+            size = -1
+        
+        return page.url, size
+    
+    def _page_changed(self, before: Tuple[str, int], after: Tuple[str, int]) -> bool:
+        """
+        Check whether two page fingerprints describe different page states.
+        
+        Args:
+            before: Earlier fingerprint
+            after: Later fingerprint
+            
+        Returns:
+            True if the page navigated or its content changed noticeably
+        """
+        if before[0] != after[0] or before[1] < 0 or after[1] < 0:
+            return True
+        
+        return abs(after[1] - before[1]) > _PAGE_CHANGE_THRESHOLD
+    
+    def _record_captcha_result(self, event_id: str, solved: bool) -> None:
+        """
+        Record the outcome of a CAPTCHA solve for an event.
+        
+        Args:
+            event_id: ID of the event
+            solved: Whether the CAPTCHA was solved
+        """
+        successes, attempts = self._captcha_stats.get(event_id, (0, 0))
+        self._captcha_stats[event_id] = (successes + solved, attempts + 1)
+    
+    def _mark_captcha_failed(self, event_id: str, proxy: Optional[Proxy]) -> None:
+        """
+        Record a failed CAPTCHA so the next attempt uses a new proxy and context.
+        
+        Args:
+            event_id: ID of the event
+            proxy: Proxy the CAPTCHA was served through, if any
+        """
+        if proxy:
+            proxy.mark_failure()
+        
+        self._captcha_failed.add(event_id)
+    
+    def _captcha_over_budget(self, event_id: str) -> bool:
+        """
+        Check whether solving an event's CAPTCHA is expected to cost more
+        attempts than the budget allows.
+        
+        With a solve rate p over k attempts, the expected number of attempts
+        is (1 - (1 - p)^k) / p.
+        
+        Args:
+            event_id: ID of the event
+            
+        Returns:
+            True if the CAPTCHA should be skipped in favour of a fresh attempt
+        """
+        successes, attempts = self._captcha_stats.get(event_id, (0, 0))
+        if attempts < _MIN_CAPTCHA_SAMPLES:
+            return False
+        
+        p = max(successes / attempts, 1e-3)
+        expected_attempts = (1 - (1 - p) ** self.max_retries) / p
+        return expected_attempts > self.captcha_attempt_budget
+    
+    def _build_credentials(self) -> Optional[Dict[str, str]]:
+        """
+        Build login credentials from config.
+        
+        Returns:
+            Mobile number or email/password credentials, or None if not configured
+        """
+        mobile = config.get("auth.mobile")
+        if mobile:
+            return {"mobile": mobile}
+        
+        email = config.get("auth.email")
+        password = config.get("auth.password")
+        if email and password:
+            return {"email": email, "password": password}
+        
+        return None
     
     async def _handle_authentication(self, page: Page, screenshot_dir: Path) -> bool:
         """
@@ -279,20 +596,13 @@ class PurchaseFlow:
         logger.info("Not logged in, attempting to authenticate")
         await self._take_screenshot(page, screenshot_dir, "02_before_login")
         
-        # Get credentials from config
-        credentials = {}
-        if config.get("auth.mobile"):
-            credentials["mobile"] = config.get("auth.mobile")
-        elif config.get("auth.email") and config.get("auth.password"):
-            credentials["email"] = config.get("auth.email")
-            credentials["password"] = config.get("auth.password")
-        else:
+        if not self._credentials:
             logger.error("No login credentials configured")
             return False
         
         # Log in
         try:
-            success = await auth_manager.login(page, credentials, session_id="bookmyshow")
+            success = await auth_manager.login(page, self._credentials, session_id="bookmyshow")
             
             if success:
                 logger.info("Login successful")
@@ -312,18 +622,59 @@ class PurchaseFlow:
         """
         Take a screenshot of the current page state.
         
+        The screenshot is captured and written in the background so the
+        purchase flow doesn't wait on image encoding and disk I/O.
+        
         Args:
             page: Page to screenshot
             directory: Directory to save screenshot in
             name: Base name for the screenshot
         """
+        if not self.screenshots_enabled:
+            return
+        
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+        
+        suffix = "png" if self.screenshot_format == "png" else "jpg"
+        task = asyncio.create_task(self._save_screenshot(page, directory / f"{name}.{suffix}"))
+        self._screenshot_tasks.setdefault(page, []).append(task)
+    
+    async def _save_screenshot(self, page: Page, screenshot_path: Path) -> None:
+        """
+        Capture a screenshot to a file.
+        
+        Args:
+            page: Page to screenshot
+            screenshot_path: File to write the screenshot to
+        """
         try:
-            screenshot_path = directory / f"{name}.png"
-            await page.screenshot(path=str(screenshot_path))
+            if self.screenshot_format == "png":
+                await page.screenshot(path=str(screenshot_path), type="png", full_page=True)
+            else:
+                await page.screenshot(
+                    path=str(screenshot_path),
+                    type="jpeg",
+                    quality=self.screenshot_quality,
+                    full_page=False
+                )
             logger.debug(f"Screenshot saved: {screenshot_path}")
         except Exception as e:
             logger.warning(f"Failed to take screenshot: {str(e)}")
     
+    async def _wait_for_screenshots(self, page: Page) -> None:
+        """
+        Wait for a page's pending screenshots to be written.
+        
+        Args:
+            page: Page the screenshots were taken of
+        """
+        tasks = self._screenshot_tasks.pop(page, None)
+        
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
     async def _extract_booking_details(self, page: Page) -> Dict[str, Any]:
         """
         Extract booking details from confirmation page.
@@ -345,146 +696,59 @@ class PurchaseFlow:
         }
         
         try:
+            # Read all booking fields from the page in one call
+            found = await page.evaluate(_BOOKING_DETAILS_JS, _BOOKING_FIELDS)
+            
             # Check for confirmation indicators
-            confirmation_selectors = [
-                "text=Booking Confirmed",
-                "text=Your transaction is successful",
-                ".success-message",
-                ".confirmation-message"
-            ]
-            
-            confirmation_found = False
-            for selector in confirmation_selectors:
-                if await page.is_visible(selector, timeout=1000):
-                    confirmation_found = True
-                    logger.info(f"Confirmation found with selector: {selector}")
-                    break
-            
-            if not confirmation_found:
+            if not found["confirmation"]:
                 logger.warning("No confirmation indicator found on page")
                 return details
             
+            logger.info(f"Confirmation found: {found['confirmation']}")
+            
             # Extract confirmation ID
-            id_selectors = [
-                ".booking-id",
-                "[data-id='booking-id']",
-                ".confirmation-id",
-                "text=/Booking ID: ([A-Z0-9]+)/"
-            ]
-            
-            for selector in id_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        text = text.strip()
-                        
-                        # Try to extract just the ID if there's extra text
-                        import re
-                        id_match = re.search(r'([A-Z0-9]{5,})', text)
-                        if id_match:
-                            details["confirmation_id"] = id_match.group(1)
-                        else:
-                            details["confirmation_id"] = text
-                        
-                        logger.info(f"Extracted confirmation ID: {details['confirmation_id']}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Error extracting confirmation ID with selector {selector}: {str(e)}")
+            text = found["id"]
+            if text:
+                # Try to extract just the ID if there's extra text
+                id_match = _ID_RE.search(text)
+                if id_match:
+                    details["confirmation_id"] = id_match.group(1)
+                else:
+                    details["confirmation_id"] = text
+                
+                logger.info(f"Extracted confirmation ID: {details['confirmation_id']}")
             
             # Extract event name
-            name_selectors = [
-                ".event-name",
-                ".movie-name",
-                "h1",
-                ".heading-name"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        details["event_name"] = await element.text_content()
-                        details["event_name"] = details["event_name"].strip()
-                        logger.debug(f"Extracted event name: {details['event_name']}")
-                        break
-                except Exception:
-                    pass
+            if found["name"]:
+                details["event_name"] = found["name"]
+                logger.debug(f"Extracted event name: {details['event_name']}")
             
             # Extract total amount
-            amount_selectors = [
-                ".total-amount",
-                ".amount-paid",
-                "text=/Total: ₹([\\d,\\.]+)/",
-                "text=/Amount Paid: ₹([\\d,\\.]+)/"
-            ]
-            
-            for selector in amount_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        text = text.strip()
-                        
-                        # Extract amount
-                        import re
-                        amount_match = re.search(r'₹\s*([\d,]+(\.\d+)?)', text)
-                        if amount_match:
-                            amount_str = amount_match.group(1).replace(',', '')
-                            details["total_amount"] = float(amount_str)
-                            logger.debug(f"Extracted total amount: ₹{details['total_amount']}")
-                            break
-                except Exception:
-                    pass
+            text = found["amount"]
+            if text:
+                amount_match = _AMOUNT_RE.search(text)
+                if amount_match:
+                    amount_str = amount_match.group(1).replace(',', '')
+                    details["total_amount"] = float(amount_str)
+                    logger.debug(f"Extracted total amount: ₹{details['total_amount']}")
             
             # Extract venue
-            venue_selectors = [
-                ".venue-name",
-                ".theatre-name",
-                "[data-id='venue']"
-            ]
-            
-            for selector in venue_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        details["venue"] = await element.text_content()
-                        details["venue"] = details["venue"].strip()
-                        logger.debug(f"Extracted venue: {details['venue']}")
-                        break
-                except Exception:
-                    pass
+            if found["venue"]:
+                details["venue"] = found["venue"]
+                logger.debug(f"Extracted venue: {details['venue']}")
             
             # Extract date and time
-            date_selectors = [
-                ".date-time",
-                ".show-date",
-                ".show-time",
-                "[data-id='show-date']",
-                "[data-id='show-time']"
-            ]
-            
-            for selector in date_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        text = text.strip()
-                        
-                        # Try to extract date and time
-                        import re
-                        date_match = re.search(r'(\d{1,2}\s+[A-Za-z]{3}|\d{1,2}/\d{1,2}/\d{2,4})', text)
-                        time_match = re.search(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))', text)
-                        
-                        if date_match:
-                            details["date"] = date_match.group(1)
-                        if time_match:
-                            details["time"] = time_match.group(1)
-                        
-                        logger.debug(f"Extracted date/time: {details['date']} {details['time']}")
-                        break
-                except Exception:
-                    pass
+            text = found["date"]
+            if text:
+                date_match = _DATE_RE.search(text)
+                time_match = _TIME_RE.search(text)
+                
+                if date_match:
+                    details["date"] = date_match.group(1)
+                if time_match:
+                    details["time"] = time_match.group(1)
+                
+                logger.debug(f"Extracted date/time: {details['date']} {details['time']}")
             
             return details
             
@@ -505,10 +769,6 @@ class PurchaseFlow:
             screenshot_dir: Directory with screenshots
         """
         try:
-            # Create bookings directory
-            bookings_dir = Path("data/bookings")
-            bookings_dir.mkdir(parents=True, exist_ok=True)
-            
             # Add event details to booking
             booking_data = {
                 "event_id": event.event_id,
@@ -520,15 +780,24 @@ class PurchaseFlow:
             }
             
             # Save to file
-            booking_file = bookings_dir / f"{event.event_id}_{booking_details.get('confirmation_id', 'unknown')}.json"
+            booking_file = self.bookings_dir / f"{event.event_id}_{booking_details.get('confirmation_id', 'unknown')}.json"
             
-            import json
-            with open(booking_file, "w") as f:
-                json.dump(booking_data, f, indent=2)
+            await asyncio.to_thread(self._write_booking_sync, booking_file, booking_data)
             
             logger.info(f"Booking details saved to {booking_file}")
         except Exception as e:
             logger.error(f"Error saving booking details: {str(e)}")
+    
+    def _write_booking_sync(self, booking_file: Path, booking_data: Dict[str, Any]) -> None:
+        """
+        Write booking details to a file. Blocking; run it in a worker thread.
+        
+        Args:
+            booking_file: File to write
+            booking_data: Booking details to write
+        """
+        with open(booking_file, "wb") as f:
+            f.write(orjson.dumps(booking_data, option=orjson.OPT_INDENT_2))
 
 
 # Singleton instance
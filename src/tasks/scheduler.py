@@ -8,14 +8,18 @@ APScheduler or Celery, with support for different schedules and priorities.
 import os
 import asyncio
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union, Callable
+from zoneinfo import ZoneInfo
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union, Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.base import JobLookupError
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.job import Job
 
 from ..config import config
@@ -26,6 +30,55 @@ from ..tasks.purchase_flow import purchase_flow
 
 logger = get_logger(__name__)
 
+# Monitoring with increasing frequency as a sale date approaches
+_SALE_DATE_SCHEDULE = tuple(
+    (days_before, interval, timedelta(days=days_before), timedelta(hours=duration))
+    for days_before, interval, duration in (
+        # days before, interval in seconds, duration in hours
+        (7, 1800, 24),    # 1 week before: every 30 minutes for 24 hours
+        (1, 600, 24),     # 1 day before: every 10 minutes for 24 hours
+        (0.5, 300, 12),   # 12 hours before: every 5 minutes for 12 hours
+        (0.25, 60, 6),    # 6 hours before: every 1 minute for 6 hours
+        (0.125, 30, 3),   # 3 hours before: every 30 seconds for 3 hours
+        (0.0625, 10, 1)   # 1.5 hours before: every 10 seconds for 1 hour
+    )
+)
+
+# Empty monitoring runs before an adaptive job's interval is doubled
+_IDLE_RUNS_BEFORE_BACKOFF = 3
+
+
+def _warn_if_in_loop(name: str) -> None:
+    """
+    Warn when a blocking method is called on the event loop.
+    
+    Args:
+        name: Name of the blocking method
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    
+    logger.warning(f"{name} called from the event loop and will block it; use the async variant")
+
+
+@lru_cache(maxsize=4096)
+def _format_run_time(run_time: datetime) -> str:
+    """
+    Format a job's next run time for display.
+    
+    Jobs keep the same next run time until they fire, so repeated job
+    listings mostly hit the cache.
+    
+    Args:
+        run_time: Next run time, in the scheduler's timezone
+        
+    Returns:
+        Run time as "YYYY-MM-DD HH:MM:SS"
+    """
+    return run_time.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+
 
 class SchedulerManager:
     """
@@ -39,12 +92,23 @@ class SchedulerManager:
         """Initialize the scheduler manager."""
         self.scheduler_type = config.get("scheduler.type", "apscheduler")
         self.timezone = config.get("scheduler.timezone", "Asia/Kolkata")
+        self._tz = ZoneInfo(self.timezone)
         self.job_store = config.get("scheduler.job_store", "sqlite")
+        self.adaptive_polling = config.get("scheduler.adaptive_polling", True)
+        self.max_interval = config.get("scheduler.max_interval", 3600)
         
         # Initialize scheduler
         self.scheduler = None
+        self.has_persistent_store = False
+        self._loop_bound = False
         self.initialized = False
         self.running = False
+        
+        # (empty runs, current interval) of adaptive monitoring jobs, by job ID
+        self._backoff: Dict[str, Tuple[int, int]] = {}
+        
+        # Purchases started by monitoring, by event ID
+        self._purchase_tasks: Dict[str, asyncio.Task] = {}
     
     def initialize(self) -> None:
         """Initialize the scheduler."""
@@ -67,26 +131,109 @@ class SchedulerManager:
     
     def _init_apscheduler(self) -> None:
         """Initialize APScheduler."""
-        # Configure jobstores
-        jobstores = {}
+        # Configure jobstores. Jobs live in memory unless they ask to be
+        # persisted, so frequent monitoring jobs never touch the database
+        jobstores = {"default": MemoryJobStore()}
         
         if self.job_store == "sqlite":
-            from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-            jobstores["default"] = SQLAlchemyJobStore(url="sqlite:///data/db/scheduler.sqlite")
+            try:
+                from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+                jobstores["persistent"] = SQLAlchemyJobStore(
+                    url="sqlite:///data/db/scheduler.sqlite",
+                    engine_options={"pool_pre_ping": True}
+                )
+            except ImportError:
+                logger.warning("SQLAlchemy not installed, persistent jobs will be kept in memory")
+        elif self.job_store == "redis":
+            try:
+                from apscheduler.jobstores.redis import RedisJobStore
+                jobstores["persistent"] = RedisJobStore(
+                    jobs_key="bms:jobs",
+                    run_times_key="bms:run_times",
+                    host=config.get("database.redis.host", "localhost"),
+                    port=config.get("database.redis.port", 6379),
+                    db=config.get("database.redis.db", 0),
+                    password=config.get("database.redis.password") or None
+                )
+            except ImportError:
+                logger.warning("redis not installed, persistent jobs will be kept in memory")
         
-        # Configure executors
+        self.has_persistent_store = "persistent" in jobstores
+        
+        # Configure executors. Jobs are coroutines, so run them straight on
+        # the event loop rather than hopping through a thread pool
         executors = {
-            "default": {"type": "threadpool", "max_workers": 20},
+            "default": AsyncIOExecutor(),
             "processpool": {"type": "processpool", "max_workers": 5}
         }
         
+        # Never run a job twice at once, and collapse missed runs into one
+        job_defaults = {
+            "coalesce": True,
+            "max_instances": 1
+        }
+        
+        # Bind to the running event loop, if any, so the scheduler can be
+        # started from a worker thread
+        try:
+            event_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            event_loop = None
+        
+        self._loop_bound = event_loop is not None
+        
         # Create scheduler
         self.scheduler = AsyncIOScheduler(
             jobstores=jobstores,
             executors=executors,
-            timezone=self.timezone
+            job_defaults=job_defaults,
+            timezone=self._tz,
+            event_loop=event_loop
         )
     
+    def _jobstore(self, persistent: bool) -> str:
+        """
+        Get the jobstore to add a job to.
+        
+        Args:
+            persistent: Whether the job should survive restarts
+            
+        Returns:
+            Jobstore alias
+        """
+        if persistent and self.has_persistent_store:
+            return "persistent"
+        return "default"
+    
+    def _is_scheduled(self, 
+                      job_id: str, 
+                      trigger: Union[IntervalTrigger, DateTrigger],
+                      args: List[Any],
+                      kwargs: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether a job is already scheduled with the same trigger and arguments.
+        
+        Args:
+            job_id: ID of the job
+            trigger: Trigger the job would be scheduled with
+            args: Positional arguments the job would be called with
+            kwargs: Keyword arguments the job would be called with
+            
+        Returns:
+            True if an identical job exists
+        """
+        job = self.scheduler.get_job(job_id)
+        
+        if job is None or type(job.trigger) is not type(trigger):
+            return False
+        
+        if isinstance(trigger, IntervalTrigger):
+            same_trigger = job.trigger.interval_length == trigger.interval_length
+        else:
+            same_trigger = job.trigger.run_date == trigger.run_date
+        
+        return same_trigger and tuple(job.args) == tuple(args) and job.kwargs == (kwargs or {})
+    
     def _init_celery(self) -> None:
         """Initialize Celery."""
         # This is a placeholder for Celery initialization
@@ -103,6 +250,32 @@ class SchedulerManager:
             self.scheduler.start()
             self.running = True
     
+    def _ensure_running(self) -> None:
+        """Initialize and start the scheduler if that hasn't happened yet."""
+        if not self.running:
+            self.start()
+    
+    async def start_async(self) -> None:
+        """
+        Start the scheduler without blocking the event loop.
+        
+        Starting loads every persisted job, so it runs in a worker thread
+        when the scheduler is bound to the running loop.
+        """
+        if not self.initialized:
+            self.initialize()
+        
+        if self.running:
+            return
+        
+        if not self._loop_bound:
+            self.start()
+            return
+        
+        logger.info("Starting scheduler")
+        await asyncio.to_thread(self.scheduler.start)
+        self.running = True
+    
     def shutdown(self) -> None:
         """Shutdown the scheduler."""
         if self.running and self.scheduler:
@@ -113,7 +286,9 @@ class SchedulerManager:
     def schedule_regular_monitoring(self, 
                                    interval: int = 60, 
                                    event_ids: Optional[List[str]] = None,
-                                   job_id: str = "regular_monitoring") -> str:
+                                   job_id: str = "regular_monitoring",
+                                   persistent: bool = False,
+                                   adaptive: Optional[bool] = None) -> str:
         """
         Schedule regular event monitoring.
         
@@ -121,49 +296,54 @@ class SchedulerManager:
             interval: Monitoring interval in seconds
             event_ids: List of event IDs to monitor, or None for all
             job_id: Unique ID for the job
+            persistent: Whether to keep the job across restarts
+            adaptive: Whether to poll less often while nothing is found, or
+                None to use the scheduler.adaptive_polling setting
             
         Returns:
             Job ID
         """
-        if not self.initialized:
-            self.initialize()
+        self._ensure_running()
+        
+        if adaptive is None:
+            adaptive = self.adaptive_polling
+        
+        trigger = IntervalTrigger(seconds=interval, timezone=self._tz)
+        args = [event_ids]
+        kwargs = {"job_id": job_id, "interval": interval} if adaptive else {}
+        
+        # Leave an identical job alone rather than rewriting it
+        if self._is_scheduled(job_id, trigger, args, kwargs):
+            logger.debug("Regular monitoring already scheduled, job ID: %s", job_id)
+            return job_id
         
         # Remove existing job with same ID if it exists
         self.remove_job(job_id)
         
-        # Create async wrapper function for the monitoring task
-        async def monitoring_task():
-            try:
-                return await event_tracker.monitor_events(
-                    event_ids=event_ids,
-                    single_run=True,
-                    notification_callback=self._on_ticket_available
-                )
-            except Exception as e:
-                logger.error(f"Error in monitoring task: {str(e)}")
-        
         # Schedule the job
         job = self.scheduler.add_job(
-            monitoring_task,
-            IntervalTrigger(seconds=interval),
+            _regular_monitoring_job,
+            trigger,
+            args=args,
+            kwargs=kwargs,
             id=job_id,
+            jobstore=self._jobstore(persistent),
             replace_existing=True,
+            misfire_grace_time=interval,
             name=f"Monitor events ({len(event_ids) if event_ids else 'all'})"
         )
         
-        event_desc = ", ".join(event_ids) if event_ids else "all events"
-        logger.info(f"Scheduled regular monitoring (every {interval}s) for {event_desc}, job ID: {job_id}")
+        if logger.isEnabledFor(logging.INFO):
+            event_desc = ", ".join(event_ids) if event_ids else "all events"
+            logger.info("Scheduled regular monitoring (every %ds) for %s, job ID: %s", interval, event_desc, job_id)
         
-        # Start the scheduler if not running
-        if not self.running:
-            self.start()
-            
         return job_id
     
     def schedule_one_time_monitoring(self, 
                                     run_date: datetime,
                                     event_ids: Optional[List[str]] = None,
-                                    job_id: Optional[str] = None) -> str:
+                                    job_id: Optional[str] = None,
+                                    persistent: bool = False) -> str:
         """
         Schedule one-time event monitoring.
         
@@ -171,46 +351,39 @@ class SchedulerManager:
             run_date: Date/time to run the monitoring
             event_ids: List of event IDs to monitor, or None for all
             job_id: Unique ID for the job, or None to generate one
+            persistent: Whether to keep the job across restarts
             
         Returns:
             Job ID
         """
-        if not self.initialized:
-            self.initialize()
+        self._ensure_running()
         
         # Generate job ID if not provided
         if job_id is None:
             job_id = f"one_time_monitoring_{run_date.strftime('%Y%m%d_%H%M%S')}"
         
-        # Create async wrapper function for the monitoring task
-        async def monitoring_task():
-            try:
-                newly_available = await event_tracker.monitor_events(
-                    event_ids=event_ids,
-                    single_run=True,
-                    notification_callback=self._on_ticket_available
-                )
-                logger.info(f"One-time monitoring completed, found {len(newly_available) if newly_available else 0} new events")
-                return newly_available
-            except Exception as e:
-                logger.error(f"Error in one-time monitoring task: {str(e)}")
+        trigger = DateTrigger(run_date=run_date, timezone=self._tz)
+        
+        # Leave an identical job alone rather than rewriting it
+        if self._is_scheduled(job_id, trigger, [event_ids]):
+            logger.debug("One-time monitoring already scheduled, job ID: %s", job_id)
+            return job_id
         
         # Schedule the job
         job = self.scheduler.add_job(
-            monitoring_task,
-            DateTrigger(run_date=run_date, timezone=self.timezone),
+            _one_time_monitoring_job,
+            trigger,
+            args=[event_ids],
             id=job_id,
+            jobstore=self._jobstore(persistent),
             replace_existing=True,
             name=f"One-time monitoring at {run_date.strftime('%Y-%m-%d %H:%M:%S')}"
         )
         
-        event_desc = ", ".join(event_ids) if event_ids else "all events"
-        logger.info(f"Scheduled one-time monitoring at {run_date} for {event_desc}, job ID: {job_id}")
+        if logger.isEnabledFor(logging.INFO):
+            event_desc = ", ".join(event_ids) if event_ids else "all events"
+            logger.info("Scheduled one-time monitoring at %s for %s, job ID: %s", run_date, event_desc, job_id)
         
-        # Start the scheduler if not running
-        if not self.running:
-            self.start()
-            
         return job_id
     
     def schedule_intensified_monitoring(self, 
@@ -219,7 +392,8 @@ class SchedulerManager:
                                        end_time: datetime,
                                        base_interval: int = 60,
                                        peak_interval: int = 5,
-                                       job_id: Optional[str] = None) -> str:
+                                       job_id: Optional[str] = None,
+                                       event: Optional[Event] = None) -> str:
         """
         Schedule intensified monitoring for a specific event.
         
@@ -230,19 +404,20 @@ class SchedulerManager:
             base_interval: Base monitoring interval in seconds
             peak_interval: Peak (intensified) monitoring interval in seconds
             job_id: Unique ID for the job, or None to generate one
+            event: The event, if the caller has already looked it up
             
         Returns:
             Job ID
         """
-        if not self.initialized:
-            self.initialize()
+        self._ensure_running()
         
         # Generate job ID if not provided
         if job_id is None:
             job_id = f"intensified_monitoring_{event_id}_{start_time.strftime('%Y%m%d_%H%M%S')}"
         
         # Get event details for logging
-        event = event_tracker.get_event(event_id)
+        if event is None:
+            event = event_tracker.get_event(event_id)
         event_name = event.name if event else event_id
         
         # Schedule regular monitoring
@@ -252,57 +427,24 @@ class SchedulerManager:
             job_id=f"{job_id}_base"
         )
         
-        # Schedule start of intensified monitoring
-        self.schedule_one_time_job(
-            lambda: self._start_intensified_monitoring(event_id, peak_interval, f"{job_id}_peak"),
-            run_date=start_time,
-            job_id=f"{job_id}_start",
-            name=f"Start intensified monitoring for {event_name}"
-        )
-        
-        # Schedule end of intensified monitoring
-        self.schedule_one_time_job(
-            lambda: self._stop_intensified_monitoring(f"{job_id}_peak"),
-            run_date=end_time,
-            job_id=f"{job_id}_end",
-            name=f"End intensified monitoring for {event_name}"
+        # Schedule intensified monitoring, bounded to its window by the trigger
+        self.scheduler.add_job(
+            _regular_monitoring_job,
+            IntervalTrigger(seconds=peak_interval, start_date=start_time, end_date=end_time, timezone=self._tz),
+            args=[[event_id]],
+            id=f"{job_id}_peak",
+            replace_existing=True,
+            misfire_grace_time=peak_interval,
+            name=f"Intensified monitoring for {event_name}"
         )
         
-        logger.info(f"Scheduled intensified monitoring for '{event_name}'")
-        logger.info(f"  Base monitoring: every {base_interval}s")
-        logger.info(f"  Intensified monitoring: every {peak_interval}s from {start_time} to {end_time}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Scheduled intensified monitoring for '%s'", event_name)
+            logger.info("  Base monitoring: every %ds", base_interval)
+            logger.info("  Intensified monitoring: every %ds from %s to %s", peak_interval, start_time, end_time)
         
-        # Start the scheduler if not running
-        if not self.running:
-            self.start()
-            
         return job_id
     
-    def _start_intensified_monitoring(self, 
-                                     event_id: str, 
-                                     interval: int, 
-                                     job_id: str) -> None:
-        """
-        Start intensified monitoring for an event.
-        
-        Args:
-            event_id: Event ID to monitor
-            interval: Monitoring interval in seconds
-            job_id: Job ID
-        """
-        logger.info(f"Starting intensified monitoring for event {event_id} (every {interval}s)")
-        self.schedule_regular_monitoring(interval=interval, event_ids=[event_id], job_id=job_id)
-    
-    def _stop_intensified_monitoring(self, job_id: str) -> None:
-        """
-        Stop intensified monitoring.
-        
-        Args:
-            job_id: Job ID to stop
-        """
-        logger.info(f"Stopping intensified monitoring (job ID: {job_id})")
-        self.remove_job(job_id)
-    
     def schedule_one_time_job(self, 
                              func: Callable, 
                              run_date: datetime,
@@ -320,51 +462,70 @@ class SchedulerManager:
         Returns:
             Job ID
         """
-        if not self.initialized:
-            self.initialize()
+        self._ensure_running()
         
         # Schedule the job
         job = self.scheduler.add_job(
             func,
-            DateTrigger(run_date=run_date, timezone=self.timezone),
+            DateTrigger(run_date=run_date, timezone=self._tz),
             id=job_id,
             replace_existing=True,
             name=name
         )
         
-        logger.info(f"Scheduled one-time job '{name}' at {run_date}, job ID: {job_id}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Scheduled one-time job '%s' at %s, job ID: %s", name, run_date, job_id)
         
-        # Start the scheduler if not running
-        if not self.running:
-            self.start()
-            
         return job_id
     
-    def get_jobs(self) -> List[Dict[str, Any]]:
+    def _add_jobs_bulk(self, jobs: List[Dict[str, Any]]) -> None:
         """
-        Get all scheduled jobs.
+        Add several jobs, waking the scheduler once rather than once per job.
         
-        Returns:
-            List of job information dictionaries
+        Args:
+            jobs: Keyword arguments for each add_job call
         """
-        if not self.initialized or not self.scheduler:
-            return []
+        # A paused scheduler doesn't wake up on add_job; resuming wakes it once
+        pause = self.running and len(jobs) > 1
         
-        jobs = []
+        if pause:
+            self.scheduler.pause()
+        
+        try:
+            for job in jobs:
+                self.scheduler.add_job(replace_existing=True, **job)
+        finally:
+            if pause:
+                self.scheduler.resume()
+    
+    def iter_jobs(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over scheduled jobs, formatting each one as it is reached.
+        
+        Yields:
+            Job information dictionaries
+        """
+        if not self.initialized or not self.scheduler:
+            return
         
         for job in self.scheduler.get_jobs():
             next_run = job.next_run_time
             
-            job_info = {
+            yield {
                 "id": job.id,
                 "name": job.name,
-                "next_run": next_run.strftime("%Y-%m-%d %H:%M:%S") if next_run else "Not scheduled",
+                "next_run": _format_run_time(next_run) if next_run else "Not scheduled",
                 "trigger": str(job.trigger)
             }
-            
-            jobs.append(job_info)
+    
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Get all scheduled jobs.
         
-        return jobs
+        Returns:
+            List of job information dictionaries
+        """
+        return list(self.iter_jobs())
     
     def remove_job(self, job_id: str) -> bool:
         """
@@ -379,6 +540,8 @@ class SchedulerManager:
         if not self.initialized or not self.scheduler:
             return False
         
+        self._backoff.pop(job_id, None)
+        
         try:
             self.scheduler.remove_job(job_id)
             logger.info(f"Removed job: {job_id}")
@@ -387,6 +550,89 @@ class SchedulerManager:
             logger.debug(f"Job not found: {job_id}")
             return False
     
+    async def _run_monitoring(self, 
+                              event_ids: Optional[List[str]],
+                              job_id: Optional[str] = None,
+                              interval: Optional[int] = None) -> None:
+        """
+        Run one pass of event monitoring.
+        
+        Args:
+            event_ids: List of event IDs to monitor, or None for all
+            job_id: ID of the job to adapt the interval of, or None for a fixed interval
+            interval: Base interval of the job in seconds
+        """
+        found = False
+        
+        try:
+            async for event in event_tracker.monitor_events(
+                event_ids=event_ids,
+                single_run=True
+            ):
+                found = True
+                await self._on_ticket_available(event)
+        except Exception as e:
+            logger.error(f"Error in monitoring task: {str(e)}")
+            return
+        
+        if job_id is not None:
+            self._adapt_interval(job_id, interval, found)
+    
+    def _adapt_interval(self, job_id: str, base_interval: int, found: bool) -> None:
+        """
+        Back a monitoring job off while its runs come up empty, and return it
+        to its base interval as soon as something is found.
+        
+        Args:
+            job_id: ID of the monitoring job
+            base_interval: Interval the job was scheduled with, in seconds
+            found: Whether the last run found available tickets
+        """
+        idle_runs, current = self._backoff.get(job_id, (0, base_interval))
+        
+        if found:
+            idle_runs, new_interval = 0, base_interval
+        else:
+            idle_runs += 1
+            new_interval = current
+            if idle_runs > _IDLE_RUNS_BEFORE_BACKOFF:
+                idle_runs = 0
+                new_interval = max(min(current * 2, self.max_interval), current)
+        
+        self._backoff[job_id] = (idle_runs, new_interval)
+        
+        if new_interval != current:
+            try:
+                self.scheduler.reschedule_job(
+                    job_id, trigger=IntervalTrigger(seconds=new_interval, timezone=self._tz)
+                )
+                logger.info(f"Monitoring job {job_id} now runs every {new_interval}s")
+            except JobLookupError:
+                self._backoff.pop(job_id, None)
+    
+    async def _run_one_time_monitoring(self, event_ids: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Run a single scheduled pass of event monitoring.
+        
+        Args:
+            event_ids: List of event IDs to monitor, or None for all
+            
+        Returns:
+            IDs of events with newly available tickets
+        """
+        try:
+            newly_available = []
+            async for event in event_tracker.monitor_events(
+                event_ids=event_ids,
+                single_run=True
+            ):
+                newly_available.append(event.event_id)
+                await self._on_ticket_available(event)
+            logger.info(f"One-time monitoring completed, found {len(newly_available)} new events")
+            return newly_available
+        except Exception as e:
+            logger.error(f"Error in one-time monitoring task: {str(e)}")
+    
     async def _on_ticket_available(self, event: Event) -> None:
         """
         Callback when tickets become available.
@@ -400,17 +646,44 @@ class SchedulerManager:
         auto_purchase = config.get("purchase.auto_purchase", True)
         
         if auto_purchase:
+            # Only one purchase task per event, however often monitoring fires
+            if event.event_id in self._purchase_tasks:
+                logger.debug(f"Purchase already running for '{event.name}'")
+                return
+            
             logger.info(f"Auto-purchase enabled, starting purchase for '{event.name}'")
             
             # Schedule the purchase task to run immediately
-            asyncio.create_task(purchase_flow.execute_purchase(event))
+            task = asyncio.create_task(purchase_flow.execute_purchase(event))
+            self._purchase_tasks[event.event_id] = task
+            task.add_done_callback(lambda _: self._purchase_tasks.pop(event.event_id, None))
         else:
             logger.info(f"Auto-purchase disabled, not purchasing tickets for '{event.name}'")
     
+    async def aschedule_sale_date_monitoring(self, event_id: str, sale_date: datetime) -> List[str]:
+        """
+        Schedule monitoring for an event with known on-sale date, without
+        blocking the event loop.
+        
+        Args:
+            event_id: Event ID to monitor
+            sale_date: Expected on-sale date/time
+            
+        Returns:
+            List of scheduled job IDs
+        """
+        # Start the scheduler here, so the worker thread never has to
+        await self.start_async()
+        
+        return await asyncio.to_thread(self.schedule_sale_date_monitoring, event_id, sale_date)
+    
     def schedule_sale_date_monitoring(self, event_id: str, sale_date: datetime) -> List[str]:
         """
         Schedule monitoring for an event with known on-sale date.
         
+        This blocks while the jobs are written; from async code, use
+        aschedule_sale_date_monitoring instead.
+        
         Args:
             event_id: Event ID to monitor
             sale_date: Expected on-sale date/time
@@ -418,8 +691,9 @@ class SchedulerManager:
         Returns:
             List of scheduled job IDs
         """
-        if not self.initialized:
-            self.initialize()
+        _warn_if_in_loop("schedule_sale_date_monitoring")
+        
+        self._ensure_running()
         
         job_ids = []
         
@@ -434,49 +708,66 @@ class SchedulerManager:
         self.schedule_regular_monitoring(
             interval=3600,  # 1 hour
             event_ids=[event_id],
-            job_id=base_job_id
+            job_id=base_job_id,
+            persistent=True,
+            adaptive=False
         )
         job_ids.append(base_job_id)
         
-        # Schedule monitoring with increasing frequency as sale date approaches
-        monitoring_schedule = [
-            # days before, interval in seconds, duration in hours
-            (7, 1800, 24),    # 1 week before: every 30 minutes for 24 hours
-            (1, 600, 24),     # 1 day before: every 10 minutes for 24 hours
-            (0.5, 300, 12),   # 12 hours before: every 5 minutes for 12 hours
-            (0.25, 60, 6),    # 6 hours before: every 1 minute for 6 hours
-            (0.125, 30, 3),   # 3 hours before: every 30 seconds for 3 hours
-            (0.0625, 10, 1)   # 1.5 hours before: every 10 seconds for 1 hour
-        ]
-        
-        for days_before, interval, duration in monitoring_schedule:
-            start_time = sale_date - timedelta(days=days_before)
-            end_time = start_time + timedelta(hours=duration)
+        # Collect a job for each intensified window, then add them together.
+        # The hourly base job above already covers base monitoring for every
+        # window
+        jobs = []
+        
+        # Naive sale dates are in the scheduler's timezone, as APScheduler
+        # reads naive run dates
+        if sale_date.tzinfo is None:
+            sale_date = sale_date.replace(tzinfo=self._tz)
+        now = datetime.now(self._tz)
+        
+        for days_before, interval, lead_time, duration in _SALE_DATE_SCHEDULE:
+            start_time = sale_date - lead_time
+            end_time = start_time + duration
             
             # Skip schedules that are in the past
-            if end_time < datetime.now():
+            if end_time < now:
                 continue
             
-            job_id = f"sale_date_{event_id}_{days_before}"
-            self.schedule_intensified_monitoring(
-                event_id=event_id,
-                start_time=start_time,
-                end_time=end_time,
-                base_interval=3600,  # Keep the base monitoring
-                peak_interval=interval,
-                job_id=job_id
-            )
+            # Start windows that are already under way straight away, rather
+            # than at their next interval
+            start_time = max(start_time, now + timedelta(seconds=1))
+            
+            job_id = f"sale_date_{event_id}_{days_before}_peak"
+            jobs.append({
+                "func": _regular_monitoring_job,
+                "trigger": IntervalTrigger(seconds=interval, start_date=start_time, end_date=end_time, timezone=self._tz),
+                "args": [[event_id]],
+                "id": job_id,
+                "misfire_grace_time": interval,
+                "name": f"Intensified monitoring for {event.name}"
+            })
             job_ids.append(job_id)
         
+        self._add_jobs_bulk(jobs)
+        
         logger.info(f"Scheduled monitoring for '{event.name}' with on-sale date {sale_date}")
         logger.info(f"  Created {len(job_ids)} monitoring schedules with increasing frequency")
         
-        # Start the scheduler if not running
-        if not self.running:
-            self.start()
-            
         return job_ids
 
 
+# Module-level job functions, so persistent jobstores can store a reference to them
+async def _regular_monitoring_job(event_ids: Optional[List[str]],
+                                  job_id: Optional[str] = None,
+                                  interval: Optional[int] = None) -> None:
+    """Run a scheduled regular monitoring pass."""
+    await scheduler_manager._run_monitoring(event_ids, job_id, interval)
+
+
+async def _one_time_monitoring_job(event_ids: Optional[List[str]]) -> Optional[List[str]]:
+    """Run a scheduled one-time monitoring pass."""
+    return await scheduler_manager._run_one_time_monitoring(event_ids)
+
+
 # Singleton instance
 scheduler_manager = SchedulerManager()
\ No newline at end of file
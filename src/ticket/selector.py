@@ -17,10 +17,130 @@ from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from ..config import config
 from ..utils.logger import get_logger
 from ..utils.browser_manager import browser_manager
+from ..utils.browser_helpers import first_visible
 
 
 logger = get_logger(__name__)
 
+# Category and seat detail patterns
+_PRICE_RE = re.compile(r'₹\s*([\d,]+)')
+_DIGIT_RE = re.compile(r'(\d+)')
+_ROW_RE = re.compile(r'row-([A-Z0-9]+)')
+_SEAT_RE = re.compile(r'seat-(\d+)')
+
+# Reads the name, full text, availability text and ID of each category
+# element in the page, so extraction takes one round trip
+_CATEGORY_DETAILS_JS = """
+elements => elements.map(element => {
+    const name = element.querySelector("h2, .category-name, .name");
+    const availability = element.querySelector(".availability, .available-count");
+    return [
+        name ? name.textContent : null,
+        element.textContent,
+        availability ? availability.textContent : null,
+        element.getAttribute("id") || ""
+    ];
+})
+"""
+
+# Elements that show the ticket selection page has rendered, whatever its
+# layout: categories, a seating map or a plain quantity input
+_TICKET_PAGE_SENTINEL = ", ".join([
+    ".TicketCategories",
+    ".ticket-types",
+    ".ticket-categories",
+    "[data-id='ticket-categories']",
+    ".seating-layout",
+    ".seat-layout",
+    ".venue-map",
+    "input[type='number']",
+    "select.ticketCount",
+    "select.quantity"
+])
+
+# Elements that show the step after ticket selection has rendered, whether
+# in place or on a new page: a CAPTCHA, a dialog or add-ons, or checkout
+_NEXT_STEP_SENTINEL = ", ".join([
+    "div.captcha",
+    ".captcha-container",
+    "img[alt*='captcha' i]",
+    "iframe[src*='recaptcha']",
+    "iframe[src*='hcaptcha']",
+    "[role='dialog']",
+    ".modal-content",
+    ".add-ons",
+    ".addon-container",
+    ".checkout-container",
+    ".payment-options",
+    ".payment-gift-card",
+    ".offers-section"
+])
+
+
+async def _wait_for_element(page: Page, selector: str, timeout: int = 10000) -> bool:
+    """
+    Wait for an element to become visible.
+    
+    Used in place of waiting for the network to go idle, which also waits
+    out analytics and other requests the next step doesn't need.
+    
+    Args:
+        page: Page object
+        selector: Selector for the element
+        timeout: Milliseconds to wait
+        
+    Returns:
+        True if the element appeared, False if the wait timed out
+    """
+    try:
+        await page.wait_for_selector(selector, state="visible", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        logger.debug(f"Timed out waiting for: {selector}")
+        return False
+
+
+async def _wait_for_next_step(page: Page, previous_url: str, timeout: int = 5000) -> bool:
+    """
+    Wait for the booking flow to move on after a step is submitted.
+    
+    The next step may load a new page or open in place, so a URL change and
+    the next step's elements are waited on together, and whichever comes
+    first ends the wait.
+    
+    Args:
+        page: Page object
+        previous_url: URL of the page before the step was submitted
+        timeout: Milliseconds to wait
+        
+    Returns:
+        True if the next step appeared, False if the wait timed out
+    """
+    tasks = [
+        asyncio.create_task(page.wait_for_url(
+            lambda url: url != previous_url, wait_until="domcontentloaded", timeout=timeout
+        )),
+        asyncio.create_task(page.wait_for_selector(_NEXT_STEP_SENTINEL, state="visible", timeout=timeout))
+    ]
+    pending = set(tasks)
+    
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return True
+        
+        return False
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Mark failed waits as handled
+                task.exception()
+
 
 class TicketSelectionError(Exception):
     """Exception raised for ticket selection errors."""
@@ -61,21 +181,18 @@ class TicketCategory:
         """
         return f"{self.name} (₹{self.price:.2f}) - {self.availability} available"
     
-    def matches_preference(self, preferences: List[str]) -> bool:
+    def matches_preference(self, preferences: Tuple[str, ...]) -> bool:
         """
         Check if this category matches any of the preferred categories.
         
         Args:
-            preferences: List of preferred category names
+            preferences: Preferred category names, upper-cased
             
         Returns:
             True if matches, False otherwise
         """
         name_upper = self.name.upper()
-        for pref in preferences:
-            if pref.upper() in name_upper or name_upper in pref.upper():
-                return True
-        return False
+        return any(pref in name_upper or name_upper in pref for pref in preferences)
 
 
 class Seat:
@@ -135,7 +252,8 @@ class TicketSelector:
         self.min_price = config.get("ticket.min_price", 0)
         self.desired_quantity = config.get("ticket.quantity", 2)
         self.max_quantity = config.get("ticket.max_quantity", 4)
-        self.preferred_areas = config.get("ticket.preferred_areas", ["GOLD", "SILVER", "PREMIUM"])
+        self.preferred_areas = tuple(config.get("ticket.preferred_areas", ["GOLD", "SILVER", "PREMIUM"]))
+        self._preferred_upper = tuple(pref.upper() for pref in self.preferred_areas)
         self.adjacent_seats_only = config.get("ticket.adjacent_seats_only", True)
         self.auto_select_best = config.get("ticket.auto_select_best", True)
     
@@ -162,14 +280,14 @@ class TicketSelector:
                 "a:has-text('Book now')"
             ]
             
-            for selector in book_button_selectors:
-                if await page.is_visible(selector, timeout=3000):
-                    await browser_manager.click(page, selector)
-                    logger.info(f"Clicked booking button using selector: {selector}")
-                    
-                    # Wait for ticket selection page to load
-                    await page.wait_for_load_state("networkidle")
-                    return True
+            selector = await first_visible(page, book_button_selectors, timeout=5000)
+            if selector:
+                await browser_manager.click(page, selector)
+                logger.info(f"Clicked booking button using selector: {selector}")
+                
+                # Wait for ticket selection page to load
+                await _wait_for_element(page, _TICKET_PAGE_SENTINEL)
+                return True
             
             logger.warning("Could not find booking button")
             return False
@@ -208,12 +326,10 @@ class TicketSelector:
             "[data-id='ticket-categories']"
         ]
         
-        for selector in category_selectors:
-            if await page.is_visible(selector, timeout=1000):
-                page_info["has_categories"] = True
-                categories = await self._extract_ticket_categories(page)
-                page_info["categories"] = categories
-                break
+        if await first_visible(page, category_selectors):
+            page_info["has_categories"] = True
+            categories = await self._extract_ticket_categories(page)
+            page_info["categories"] = categories
         
         # Check for seat selection interface
         seat_selection_selectors = [
@@ -222,10 +338,8 @@ class TicketSelector:
             ".venue-map"
         ]
         
-        for selector in seat_selection_selectors:
-            if await page.is_visible(selector, timeout=1000):
-                page_info["is_reserved_seating"] = True
-                break
+        if await first_visible(page, seat_selection_selectors):
+            page_info["is_reserved_seating"] = True
         
         # Calculate available ticket count and price range
         if page_info["has_categories"]:
@@ -267,20 +381,17 @@ class TicketSelector:
             ]
             
             for selector in category_item_selectors:
-                category_elements = await page.query_selector_all(selector)
-                if category_elements:
-                    logger.debug(f"Found {len(category_elements)} ticket categories with selector: {selector}")
+                category_details = await page.eval_on_selector_all(selector, _CATEGORY_DETAILS_JS)
+                if category_details:
+                    logger.debug(f"Found {len(category_details)} ticket categories with selector: {selector}")
                     
-                    for element in category_elements:
+                    for name, price_text, availability_text, element_id in category_details:
                         try:
                             # Extract category name
-                            name_element = await element.query_selector("h2, .category-name, .name")
-                            name = await name_element.text_content() if name_element else "Unknown"
-                            name = name.strip()
+                            name = name.strip() if name is not None else "Unknown"
                             
                             # Extract price
-                            price_text = await element.text_content()
-                            price_match = re.search(r'₹\s*([\d,]+)', price_text)
+                            price_match = _PRICE_RE.search(price_text)
                             price = 0
                             if price_match:
                                 price_str = price_match.group(1).replace(',', '')
@@ -288,16 +399,11 @@ class TicketSelector:
                             
                             # Extract availability if present
                             availability = 0
-                            availability_element = await element.query_selector(".availability, .available-count")
-                            if availability_element:
-                                availability_text = await availability_element.text_content()
-                                availability_match = re.search(r'(\d+)', availability_text)
+                            if availability_text:
+                                availability_match = _DIGIT_RE.search(availability_text)
                                 if availability_match:
                                     availability = int(availability_match.group(1))
                             
-                            # Get element ID for later selection
-                            element_id = await element.get_attribute("id") or ""
-                            
                             # Create category and add to list
                             category = TicketCategory(
                                 name=name,
@@ -398,7 +504,7 @@ class TicketSelector:
         other_categories = []
         
         for cat in valid_categories:
-            if cat.matches_preference(self.preferred_areas):
+            if cat.matches_preference(self._preferred_upper):
                 preferred_categories.append(cat)
             else:
                 other_categories.append(cat)
@@ -471,10 +577,10 @@ class TicketSelector:
                     logger.info(f"Found {len(sections)} seating sections")
                     
                     # Try preferred sections first
-                    for pref in self.preferred_areas:
+                    for pref in self._preferred_upper:
                         for section in sections:
                             section_text = await section.text_content()
-                            if pref.upper() in section_text.upper():
+                            if pref in section_text.upper():
                                 await section.click()
                                 await browser_manager.random_delay()
                                 logger.info(f"Selected preferred section: {section_text}")
@@ -491,10 +597,6 @@ class TicketSelector:
                     
                     break
             
-            # Wait for seat map to load
-            await page.wait_for_load_state("networkidle")
-            await browser_manager.random_delay()
-            
             # Look for available seats
             seat_selectors = [
                 ".available-seat",
@@ -503,16 +605,21 @@ class TicketSelector:
                 "[data-status='available']"
             ]
             
+            # Wait for seat map to load
+            await _wait_for_element(page, ", ".join(seat_selectors))
+            await browser_manager.random_delay()
+            
             for selector in seat_selectors:
                 available_seats = await page.query_selector_all(selector)
                 if available_seats:
                     logger.info(f"Found {len(available_seats)} available seats with selector: {selector}")
                     
-                    if self.adjacent_seats_only:
+                    if self.adjacent_seats_only and self.desired_quantity > 1:
                         # Try to find adjacent seats
-                        selected_seats = await self._find_adjacent_seats(page, available_seats, selector)
+                        selected_seats = await self._find_adjacent_seats(page, available_seats)
                     else:
-                        # Just select the first N available seats
+                        # Just select the first N available seats; a single
+                        # seat is always "adjacent"
                         selected_seats = available_seats[:self.desired_quantity]
                     
                     # Click on selected seats
@@ -533,14 +640,13 @@ class TicketSelector:
             logger.error(f"Error selecting reserved seats: {str(e)}")
             return False
     
-    async def _find_adjacent_seats(self, page: Page, all_seats: List, seat_selector: str) -> List:
+    async def _find_adjacent_seats(self, page: Page, all_seats: List) -> List:
         """
         Find adjacent seats in the seating map.
         
         Args:
             page: Page object
             all_seats: List of all available seat elements
-            seat_selector: CSS selector for available seats
             
         Returns:
             List of adjacent seat elements
@@ -548,15 +654,19 @@ class TicketSelector:
         logger.info(f"Looking for {self.desired_quantity} adjacent seats")
         
         try:
+            # Read every seat's ID and class in a single round trip
+            attributes = await page.evaluate(
+                "seats => seats.map(s => [s.getAttribute('id') || '', s.getAttribute('class') || ''])",
+                all_seats
+            )
+            
             # Get seat IDs and positions
             seat_positions = []
-            for seat in all_seats:
-                seat_id = await seat.get_attribute("id") or ""
-                seat_class = await seat.get_attribute("class") or ""
-                
-                # Try to extract row and seat number
-                row_match = re.search(r'row-([A-Z0-9]+)', seat_id) or re.search(r'row-([A-Z0-9]+)', seat_class)
-                seat_match = re.search(r'seat-(\d+)', seat_id) or re.search(r'seat-(\d+)', seat_class)
+            for seat, (seat_id, seat_class) in zip(all_seats, attributes):
+                # Try to extract row and seat number, preferring the ID
+                seat_attrs = f"{seat_id} {seat_class}"
+                row_match = _ROW_RE.search(seat_attrs)
+                seat_match = _SEAT_RE.search(seat_attrs)
                 
                 if row_match and seat_match:
                     row = row_match.group(1)
@@ -572,34 +682,25 @@ class TicketSelector:
                 logger.warning("Could not extract seat positions")
                 return all_seats[:self.desired_quantity]
             
-            # Group seats by row
-            rows = {}
+            # Order seats by row, keeping rows in the order they appear, then
+            # by seat number
+            row_order = {}
             for pos in seat_positions:
-                row = pos["row"]
-                if row not in rows:
-                    rows[row] = []
-                rows[row].append(pos)
-            
-            # Sort seats within each row
-            for row in rows:
-                rows[row].sort(key=lambda x: x["seat"])
-            
-            # Find adjacent seats in each row
-            for row, seats in rows.items():
-                if len(seats) < self.desired_quantity:
-                    continue
+                row_order.setdefault(pos["row"], len(row_order))
+            seat_positions.sort(key=lambda x: (row_order[x["row"]], x["seat"]))
+            
+            # Walk the seats once, tracking where the current run of
+            # consecutive seats in a row began
+            run_start = 0
+            for i, pos in enumerate(seat_positions):
+                if i > run_start:
+                    prev = seat_positions[i - 1]
+                    if pos["row"] != prev["row"] or pos["seat"] != prev["seat"] + 1:
+                        run_start = i
                 
-                for i in range(len(seats) - self.desired_quantity + 1):
-                    # Check if this is a consecutive block
-                    is_consecutive = True
-                    for j in range(1, self.desired_quantity):
-                        if seats[i + j]["seat"] != seats[i + j - 1]["seat"] + 1:
-                            is_consecutive = False
-                            break
-                    
-                    if is_consecutive:
-                        logger.info(f"Found {self.desired_quantity} adjacent seats in row {row}")
-                        return [seat["element"] for seat in seats[i:i + self.desired_quantity]]
+                if i - run_start + 1 >= self.desired_quantity:
+                    logger.info(f"Found {self.desired_quantity} adjacent seats in row {pos['row']}")
+                    return [seat["element"] for seat in seat_positions[i + 1 - self.desired_quantity:i + 1]]
             
             logger.warning(f"Could not find {self.desired_quantity} adjacent seats")
             
@@ -695,6 +796,13 @@ class TicketSelector:
                 "input[type='submit']"
             ]
             
+            # Wait once for any of the buttons, rather than once per selector
+            try:
+                await page.wait_for_selector(", ".join(proceed_selectors), state="attached", timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.warning("Could not find proceed button")
+                return False
+            
             for selector in proceed_selectors:
                 proceed_button = await page.query_selector(selector)
                 if proceed_button:
@@ -704,11 +812,13 @@ class TicketSelector:
                         logger.warning(f"Proceed button is disabled: {selector}")
                         continue
                     
+                    current_url = page.url
                     await browser_manager.click(page, selector)
                     logger.debug(f"Clicked proceed button: {selector}")
                     
-                    # Wait for navigation to complete
-                    await page.wait_for_load_state("networkidle", timeout=10000)
+                    # Wait for the next step to load, in place or as a new page
+                    if not await _wait_for_next_step(page, current_url):
+                        logger.warning("Next step did not appear after clicking proceed")
                     return True
             
             logger.warning("Could not find proceed button")
@@ -0,0 +1,76 @@
+"""
+Browser helper functions for the BookMyShow Bot.
+
+This module provides small page utilities shared by the ticket selection
+and payment modules.
+"""
+
+import asyncio
+from typing import Optional, Sequence
+
+from playwright.async_api import Page
+
+
+async def _wait_for_any(page: Page, selectors: Sequence[str], timeout: float) -> bool:
+    """
+    Wait until any of several selectors becomes visible.
+    
+    All selectors are waited on in parallel, so the wait ends as soon as any
+    of them matches rather than after trying each one in turn.
+    
+    Args:
+        page: Page object
+        selectors: Selectors to wait for
+        timeout: Maximum time to wait in milliseconds
+        
+    Returns:
+        True if any selector became visible, False if none did
+    """
+    tasks = [
+        asyncio.create_task(page.locator(selector).first.wait_for(state="visible", timeout=timeout))
+        for selector in selectors
+    ]
+    pending = set(tasks)
+    
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return True
+        
+        return False
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Mark failed waits as handled
+                task.exception()
+
+
+async def first_visible(page: Page, selectors: Sequence[str], timeout: float = 0) -> Optional[str]:
+    """
+    Find the first of several candidate selectors that is visible.
+    
+    Candidates are checked concurrently, so a page showing none of them costs
+    about one round trip rather than one per selector. When several are
+    visible, the earliest in ``selectors`` wins, whichever answered first.
+    
+    Args:
+        page: Page object
+        selectors: Candidate selectors, in order of preference
+        timeout: Milliseconds to wait for any candidate to appear, or 0 to
+            check only once
+        
+    Returns:
+        First visible selector, or None if none are visible
+    """
+    if timeout and not await _wait_for_any(page, selectors, timeout):
+        return None
+    
+    visible = await asyncio.gather(*(page.locator(selector).first.is_visible() for selector in selectors))
+    
+    return next((selector for selector, is_visible in zip(selectors, visible) if is_visible), None)
+
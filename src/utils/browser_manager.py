@@ -58,6 +58,9 @@ class BrowserManager:
         self.session_path = Path(config.get("auth.session_path", "data/sessions"))
         self.session_path.mkdir(parents=True, exist_ok=True)
         
+        # Parsed session files by session ID, with the mtime they were read at
+        self._sessions: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        
         # Proxy settings
         self.proxy_enabled = config.get("proxy.enabled", False)
         self.proxy_config = self._get_proxy_config() if self.proxy_enabled else None
@@ -120,13 +123,15 @@ class BrowserManager:
     
     async def create_context(self, 
                             load_session: bool = False, 
-                            session_id: Optional[str] = None) -> BrowserContext:
+                            session_id: Optional[str] = None,
+                            proxy: Optional[Dict[str, str]] = None) -> BrowserContext:
         """
         Create a new browser context with anti-detection measures.
         
         Args:
             load_session: Whether to load a saved session
             session_id: ID of the session to load
+            proxy: Playwright proxy settings, overriding the configured proxy
             
         Returns:
             Browser context
@@ -138,20 +143,16 @@ class BrowserManager:
         context_options = self._get_stealth_context_options()
         
         # Add proxy if enabled
-        if self.proxy_enabled and self.proxy_config:
+        if proxy:
+            context_options["proxy"] = proxy
+        elif self.proxy_enabled and self.proxy_config:
             context_options["proxy"] = self.proxy_config
         
         # Load session state if requested
         if load_session and session_id:
-            session_file = self.session_path / f"{session_id}.json"
-            if session_file.exists():
-                try:
-                    with open(session_file, "r") as f:
-                        storage_state = json.load(f)
-                    context_options["storage_state"] = storage_state
-                    logger.info(f"Loaded session from {session_file}")
-                except Exception as e:
-                    logger.error(f"Failed to load session: {e}")
+            storage_state = self._load_session(session_id)
+            if storage_state is not None:
+                context_options["storage_state"] = storage_state
         
         # Create the context
         context = await self._browser.new_context(**context_options)
@@ -162,6 +163,38 @@ class BrowserManager:
         self._context = context
         return context
     
+    def _load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a saved session, reusing the parsed copy if the file is unchanged.
+        
+        Args:
+            session_id: ID of the session to load
+            
+        Returns:
+            Storage state, or None if there is no usable saved session
+        """
+        session_file = self.session_path / f"{session_id}.json"
+        
+        try:
+            mtime = session_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        cached = self._sessions.get(session_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        try:
+            with open(session_file, "r") as f:
+                storage_state = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load session: {e}")
+            return None
+        
+        self._sessions[session_id] = (mtime, storage_state)
+        logger.info(f"Loaded session from {session_file}")
+        return storage_state
+    
     async def new_page(self, context: Optional[BrowserContext] = None) -> Page:
         """
         Create a new page in the specified or current context.
@@ -0,0 +1,39 @@
+"""
+Tests for the notification module.
+"""
+
+import time
+
+from src.notification.alerts import DedupCache
+
+
+def test_dedup_cache_suppresses_repeats():
+    """Test that a key is reported as a duplicate within its TTL."""
+    cache = DedupCache()
+
+    assert cache.seen("key", 60) is False
+    assert cache.seen("key", 60) is True
+    assert cache.seen("other", 60) is False
+
+
+def test_dedup_cache_expiry():
+    """Test that a key is accepted again once its TTL has passed."""
+    cache = DedupCache()
+
+    assert cache.seen("key", 0.05) is False
+    time.sleep(0.1)
+    assert cache.seen("key", 0.05) is False
+
+
+def test_dedup_cache_evicts_least_recent():
+    """Test that the cache never holds more than maxsize keys."""
+    cache = DedupCache(maxsize=2)
+
+    cache.seen("a", 60)
+    cache.seen("b", 60)
+    cache.seen("a", 60)
+    cache.seen("c", 60)
+
+    # "b" was the least recently seen key and has been evicted
+    assert cache.seen("b", 60) is False
+    assert cache.seen("a", 60) is False